@@ -27,6 +27,7 @@ except Exception:
 
 # Import the collector registry to dynamically discover services
 from collectors import COLLECTOR_FUNCTIONS
+from aws_utils import get_client, get_session
 
 app = FastAPI(
     title="AWS Inventory API",
@@ -308,8 +309,10 @@ def _get_live_monthly_costs(profile: str) -> Dict[str, Any]:
         return empty
 
     try:
-        session = boto3.Session(profile_name=profile)
-        ce = session.client("ce", region_name="us-east-1")
+        session = get_session(profile)
+        if session is None:
+            return empty
+        ce = get_client(session, "ce", "us-east-1")
 
         today = date.today()
         current_month_start = today.replace(day=1)
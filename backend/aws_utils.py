@@ -1,15 +1,56 @@
 """Shared helpers for AWS sessions, error handling, and formatting."""
 from __future__ import annotations
 
+import contextlib
 import datetime
+import functools
 import json
 import os
-from typing import Any, Callable, Iterable, Optional
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 import boto3
+import botocore.session
+from botocore.config import Config
 from botocore.exceptions import ClientError, ProfileNotFound
 
-from config import REGION, safe_call
+from config import REGION, load_config_yaml, safe_call
+
+
+# Worker threads used by collectors that fan out one API call per resource,
+# unless services.yaml sets ``max_workers``.
+DEFAULT_FANOUT_WORKERS = 16
+
+
+def fanout_workers() -> int:
+    """Fan-out worker count: ``max_workers`` from services.yaml, else the default.
+
+    Read when a pool is built rather than at import, so importing this module
+    does no config IO and edits apply to the next scan without a restart.
+    """
+    try:
+        workers = int(load_config_yaml("services.yaml").get("max_workers"))
+    except Exception:
+        return DEFAULT_FANOUT_WORKERS
+    return workers if workers > 0 else DEFAULT_FANOUT_WORKERS
+
+
+# Applied to every client created from a session returned by get_session(),
+# with the connection pool sized when the session is built (see
+# _new_botocore_session) so fan-out workers don't discard connections.
+# Adaptive retries back off client-side when describe calls get throttled;
+# clients are shared, so several collectors may fan out on the same one (EC2
+# especially). TCP keep-alive stops idle pooled sockets from being dropped
+# between bursts, and a short connect timeout fails fast on unreachable
+# regional endpoints instead of waiting out botocore's 60 s default.
+CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+)
 
 
 def ensure_output_dirs(*paths: str) -> None:
@@ -25,36 +66,172 @@ def sanitize_filename(name: Optional[str]) -> str:
     return sanitized or "sheet"
 
 
+# One session per profile: each boto3.Session re-reads the AWS config files and
+# builds its own credential resolver, so repeated lookups reuse the first one.
+# Profiles are scanned and served from several threads; the lock makes sure a
+# profile's session is only built once, while hits stay lock-free.
+_SESSIONS: dict[str, boto3.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+# Service models and endpoint data are the same for every profile. Sessions
+# share the first session's loader so each model is parsed once per process.
+_DATA_LOADER = None
+
+
+def _new_botocore_session():
+    global _DATA_LOADER
+    botocore_session = botocore.session.get_session()
+    if _DATA_LOADER is None:
+        _DATA_LOADER = botocore_session.get_component("data_loader")
+    else:
+        botocore_session.register_component("data_loader", _DATA_LOADER)
+    botocore_session.set_default_client_config(
+        CLIENT_CONFIG.merge(Config(max_pool_connections=max(fanout_workers(), 32)))
+    )
+    return botocore_session
+
+
 def get_session(profile: str):
+    session = _SESSIONS.get(profile)
+    if session is not None:
+        return session
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(profile)
+        if session is not None:
+            return session
+        botocore_session = _new_botocore_session()
+        try:
+            session = boto3.Session(botocore_session=botocore_session, profile_name=profile, region_name=REGION)
+            # With a pre-registered loader nothing in the constructor reads the
+            # profile's config, so resolve it here to surface ProfileNotFound.
+            botocore_session.get_scoped_config()
+        except ProfileNotFound:
+            return None
+        finally:
+            # Every boto3.Session appends boto3's data path to the loader;
+            # keep the shared loader's search path list free of repeats.
+            _DATA_LOADER.search_paths[:] = dict.fromkeys(_DATA_LOADER.search_paths)
+        _SESSIONS[profile] = session
+    return session
+
+
+# Clients keyed by session, then (service, region). botocore sessions are not
+# safe to build clients from concurrently, so creation is serialised; the
+# clients themselves are thread-safe and shared across collectors and regions.
+_CLIENTS = weakref.WeakKeyDictionary()
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(session, service_name: str, region_name: Optional[str] = None):
+    """Return a cached ``session.client(service_name, region_name=...)``."""
+    key = (service_name, region_name)
+    with _CLIENTS_LOCK:
+        clients = _CLIENTS.setdefault(session, {})
+        client = clients.get(key)
+        if client is None:
+            client = clients[key] = session.client(service_name, region_name=region_name)
+    return client
+
+
+# Account IDs keyed by session; entries go away with the session.
+_ACCOUNT_IDS = weakref.WeakKeyDictionary()
+
+
+def get_account_id(session) -> str:
+    """Return the caller's account ID, calling STS at most once per session."""
+    account_id = _ACCOUNT_IDS.get(session)
+    if account_id:
+        return account_id
+    sts = get_client(session, "sts")
+    account_id = safe_call(lambda: sts.get_caller_identity().get("Account", ""), "")
+    if account_id:
+        _ACCOUNT_IDS[session] = account_id
+    return account_id
+
+
+def iter_pages(paginator, **kwargs) -> Iterator[dict]:
+    """Yield pages from ``paginator`` as they arrive.
+
+    Mirrors :func:`safe_call`: an API error ends the iteration with a warning
+    instead of propagating, but pages already received are kept.
+    """
     try:
-        return boto3.Session(profile_name=profile, region_name=REGION)
-    except ProfileNotFound:
-        return None
+        yield from paginator.paginate(**kwargs)
+    except Exception as exc:
+        print(f"  ⚠ Warning: {type(exc).__name__}: {exc}")
 
 
-def get_instance_type_specs(ec2_client, instance_type: str) -> dict[str, Optional[float]]:
+# Collectors that run side by side on one session's clients split the fan-out
+# budget between them, so their calls together stay within fanout_workers()
+# and the connection pool instead of multiplying it.
+_FANOUT_SHARE = threading.local()
+
+
+@contextlib.contextmanager
+def fanout_share(parallel: int) -> Iterator[None]:
+    """Give map_concurrently calls on this thread 1/``parallel`` of the fan-out workers."""
+    previous = getattr(_FANOUT_SHARE, "parallel", 1)
+    _FANOUT_SHARE.parallel = max(parallel, 1)
+    try:
+        yield
+    finally:
+        _FANOUT_SHARE.parallel = previous
+
+
+def map_concurrently(fn: Callable[[Any], Any], items: Iterable[Any], max_workers: Optional[int] = None) -> list:
+    """Apply ``fn`` to each item on a thread pool, returning results in input order.
+
+    ``max_workers`` defaults to this thread's share of :func:`fanout_workers`
+    (see :func:`fanout_share`).
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    if max_workers is None:
+        max_workers = max(fanout_workers() // getattr(_FANOUT_SHARE, "parallel", 1), 1)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+# Instance type -> specs. Hardware specs don't vary by account or region, so
+# one lookup per type serves every collector for the rest of the process.
+_INSTANCE_TYPE_SPECS: dict[str, dict[str, Optional[float]]] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_instance_type_file() -> dict[str, dict[str, Optional[float]]]:
     cache_file = os.path.join(os.path.dirname(__file__), "instance_types.json")
-    if os.path.exists(cache_file):
+    index: dict[str, dict[str, Optional[float]]] = {}
+    try:
+        with open(cache_file, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+        for item in data.get("InstanceTypes", []):
+            index.setdefault(item.get("InstanceType"), {
+                "vcpus": item.get("VCpuInfo", {}).get("DefaultVCpus"),
+                "memory_mb": item.get("MemoryInfo", {}).get("SizeInMiB"),
+            })
+    except Exception:
+        pass
+    return index
+
+
+def get_instance_type_specs(ec2_client, instance_type: str) -> dict[str, Optional[float]]:
+    specs = _INSTANCE_TYPE_SPECS.get(instance_type) or _load_instance_type_file().get(instance_type)
+    if specs is None:
         try:
-            with open(cache_file, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-            for item in data.get("InstanceTypes", []):
-                if item.get("InstanceType") == instance_type:
-                    return {
-                        "vcpus": item.get("VCpuInfo", {}).get("DefaultVCpus"),
-                        "memory_mb": item.get("MemoryInfo", {}).get("SizeInMiB"),
-                    }
+            resp = ec2_client.describe_instance_types(InstanceTypes=[instance_type])
+            details = (resp.get("InstanceTypes") or [None])[0] or {}
         except Exception:
-            pass
-    try:
-        resp = ec2_client.describe_instance_types(InstanceTypes=[instance_type])
-        details = resp.get("InstanceTypes", [None])[0] or {}
-        return {
+            details = {}
+        specs = {
             "vcpus": details.get("VCpuInfo", {}).get("DefaultVCpus"),
             "memory_mb": details.get("MemoryInfo", {}).get("SizeInMiB"),
         }
-    except Exception:
-        return {"vcpus": None, "memory_mb": None}
+        if not details:
+            # Empty or failed lookup; don't cache it so the next call retries
+            return specs
+    _INSTANCE_TYPE_SPECS[instance_type] = specs
+    return dict(specs)
 
 
 def sum_s3_bucket_size(s3_client, bucket_name: str) -> tuple[int, int]:
@@ -1,6 +1,8 @@
 """Aggregated registry for all AWS service collectors."""
 from __future__ import annotations
 
+import types
+
 # ---- Original collectors (backend-new) ----
 from .apigateway import collect_apigateway_all, collect_apigateway_v2
 from .cloudfront import collect_cloudfront
@@ -106,7 +108,9 @@ from .snapshot import collect_snapshots
 from .storagegateway import collect_storagegateway
 
 
-COLLECTOR_FUNCTIONS = {
+# Read-only view: the registry is shared by the runner and the API server and
+# is never meant to be modified at runtime.
+COLLECTOR_FUNCTIONS = types.MappingProxyType({
     # ---------- Original ----------
     "API Gateway": collect_apigateway_all,
     "CloudFront": collect_cloudfront,
@@ -199,7 +203,7 @@ COLLECTOR_FUNCTIONS = {
     "EFS": collect_efs,
     "Snapshots": collect_snapshots,
     "StorageGateway": collect_storagegateway,
-}
+})
 
 __all__ = [
     "COLLECTOR_FUNCTIONS",
@@ -3,18 +3,17 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages
 from config import REGION
 
 
 def collect_ami(session, cost_map) -> pd.DataFrame:
-    client = session.client("ec2", region_name=REGION)
+    client = get_client(session, "ec2", region_name=REGION)
     rows = []
 
-    images = safe_call(
-        lambda: client.describe_images(Owners=["self"]).get("Images", []), []
-    )
-    for img in images or []:
+    paginator = client.get_paginator("describe_images")
+    pages = iter_pages(paginator, Owners=["self"], PaginationConfig={"PageSize": 1000})
+    for img in (img for page in pages for img in page.get("Images", [])):
         tags = {t["Key"]: t["Value"] for t in (img.get("Tags") or [])}
         rows.append({
             "ImageId": img.get("ImageId", ""),
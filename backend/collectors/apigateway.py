@@ -9,7 +9,7 @@ from urllib.parse import urlparse
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
@@ -43,9 +43,9 @@ def _extract_load_balancer_hosts(resources: Iterable[dict]) -> List[str]:
 
 def collect_apigateway_all(session, cost_map):
     rows = []
-    cw = session.client("cloudwatch", region_name=REGION)
+    cw = get_client(session, "cloudwatch", region_name=REGION)
     # REST APIs
-    ag_rest = session.client("apigateway", region_name=REGION)
+    ag_rest = get_client(session, "apigateway", region_name=REGION)
     rest_apis = _get_paginated_items(ag_rest, "get_rest_apis", "items")
     for a in rest_apis or []:
         api_id = a.get("id")
@@ -120,7 +120,7 @@ def collect_apigateway_all(session, cost_map):
             "LoadBalancers": "\n".join(load_balancers) if load_balancers else "",
         })
     # HTTP & WebSocket APIs
-    ag_v2 = session.client("apigatewayv2", region_name=REGION)
+    ag_v2 = get_client(session, "apigatewayv2", region_name=REGION)
     v2_apis = _get_paginated_items(ag_v2, "get_apis", "Items")
     for a in v2_apis or []:
         api_id = a.get("ApiId")
@@ -184,7 +184,7 @@ def collect_apigateway_all(session, cost_map):
 
 
 def collect_apigateway_v2(session, cost_map):
-    ag = session.client("apigatewayv2", region_name=REGION)
+    ag = get_client(session, "apigatewayv2", region_name=REGION)
     rows = []
     apis = _get_paginated_items(ag, "get_apis", "Items")
     for a in apis or []:
@@ -3,16 +3,16 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages
 from config import REGION
 
 
 def collect_asg(session, cost_map) -> pd.DataFrame:
-    client = session.client("autoscaling", region_name=REGION)
+    client = get_client(session, "autoscaling", region_name=REGION)
     rows = []
 
     paginator = client.get_paginator("describe_auto_scaling_groups")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for asg in page.get("AutoScalingGroups", []):
             tags = {t["Key"]: t["Value"] for t in (asg.get("Tags") or [])}
             instance_types = list({
@@ -3,17 +3,17 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages, safe_call
 from config import REGION
 
 
 def collect_awsconfig(session, cost_map) -> pd.DataFrame:
-    client = session.client("config", region_name=REGION)
+    client = get_client(session, "config", region_name=REGION)
     rows = []
 
     # Config rules
     paginator = client.get_paginator("describe_config_rules")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for rule in page.get("ConfigRules", []):
             source = rule.get("Source", {})
             compliance = safe_call(
@@ -3,17 +3,16 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_account_id, get_client, safe_call
 from config import REGION
 
 
 def collect_budgets(session, cost_map) -> pd.DataFrame:
-    sts = session.client("sts")
-    account_id = safe_call(lambda: sts.get_caller_identity().get("Account", ""), "")
+    account_id = get_account_id(session)
     if not account_id:
         return pd.DataFrame()
 
-    client = session.client("budgets", region_name="us-east-1")
+    client = get_client(session, "budgets", region_name="us-east-1")
     rows = []
 
     budgets = safe_call(
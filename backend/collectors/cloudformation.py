@@ -3,16 +3,16 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages
 from config import REGION
 
 
 def collect_cloudformation(session, cost_map) -> pd.DataFrame:
-    client = session.client("cloudformation", region_name=REGION)
+    client = get_client(session, "cloudformation", region_name=REGION)
     rows = []
 
     paginator = client.get_paginator("describe_stacks")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for stack in page.get("Stacks", []):
             tags = {t["Key"]: t["Value"] for t in (stack.get("Tags") or [])}
             outputs = ", ".join(
@@ -3,11 +3,11 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 
 
 def collect_cloudfront(session, cost_map):
-    cf = session.client("cloudfront")
+    cf = get_client(session, "cloudfront")
     rows = []
     dist_list = safe_call(lambda: cf.list_distributions().get("DistributionList", {}).get("Items", []), [])
     for d in dist_list or []:
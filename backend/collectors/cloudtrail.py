@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_cloudtrail(session, cost_map) -> pd.DataFrame:
-    client = session.client("cloudtrail", region_name=REGION)
+    client = get_client(session, "cloudtrail", region_name=REGION)
     rows = []
 
     trails = safe_call(lambda: client.describe_trails().get("trailList", []), [])
@@ -2,10 +2,10 @@
 from __future__ import annotations
 import pandas as pd
 from config import REGION
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 
 def collect_cloudwatch_logs(session, cost_map):
-    logs = session.client("logs", region_name=REGION)
+    logs = get_client(session, "logs", region_name=REGION)
     log_groups = safe_call(lambda: logs.describe_log_groups()["logGroups"], [])
     rows = []
     for lg in log_groups:
@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_cloudwatchevent(session, cost_map):
-    events = session.client("events", region_name=REGION)
+    events = get_client(session, "events", region_name=REGION)
     rows = []
     rules = safe_call(lambda: events.list_rules().get("Rules", []), [])
     for rule in rules or []:
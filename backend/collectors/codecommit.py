@@ -3,16 +3,16 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages, safe_call
 from config import REGION
 
 
 def collect_codecommit(session, cost_map) -> pd.DataFrame:
-    client = session.client("codecommit", region_name=REGION)
+    client = get_client(session, "codecommit", region_name=REGION)
     rows = []
 
     paginator = client.get_paginator("list_repositories")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for repo in page.get("repositories", []):
             name = repo.get("repositoryName", "")
             detail = safe_call(
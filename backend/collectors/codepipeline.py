@@ -3,16 +3,16 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages, safe_call
 from config import REGION
 
 
 def collect_codepipeline(session, cost_map) -> pd.DataFrame:
-    client = session.client("codepipeline", region_name=REGION)
+    client = get_client(session, "codepipeline", region_name=REGION)
     rows = []
 
     paginator = client.get_paginator("list_pipelines")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for pl in page.get("pipelines", []):
             name = pl.get("name", "")
             detail = safe_call(
@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages, safe_call
 from config import REGION
 
 
 def collect_controltower(session, cost_map) -> pd.DataFrame:
-    client = session.client("controltower", region_name=REGION)
+    client = get_client(session, "controltower", region_name=REGION)
     rows = []
 
     # List landing zones
@@ -32,7 +32,7 @@ def collect_controltower(session, cost_map) -> pd.DataFrame:
 
     # List enabled controls
     paginator = client.get_paginator("list_enabled_controls")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for ctrl in page.get("enabledControls", []):
             rows.append({
                 "ResourceType": "EnabledControl",
@@ -5,12 +5,12 @@ from datetime import date, timedelta
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_costexplorer(session, cost_map) -> pd.DataFrame:
-    client = session.client("ce", region_name="us-east-1")
+    client = get_client(session, "ce", region_name="us-east-1")
     rows = []
 
     today = date.today()
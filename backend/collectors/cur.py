@@ -3,17 +3,17 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages
 from config import REGION
 
 
 def collect_cur(session, cost_map) -> pd.DataFrame:
     # CUR API is only available in us-east-1
-    client = session.client("cur", region_name="us-east-1")
+    client = get_client(session, "cur", region_name="us-east-1")
     rows = []
 
     paginator = client.get_paginator("describe_report_definitions")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for report in page.get("ReportDefinitions", []):
             rows.append({
                 "ReportName": report.get("ReportName", ""),
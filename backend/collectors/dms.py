@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_dms(session, cost_map):
-    dms = session.client("dms", region_name=REGION)
+    dms = get_client(session, "dms", region_name=REGION)
     rows = []
 
     instances = safe_call(lambda: dms.describe_replication_instances().get("ReplicationInstances", []), [])
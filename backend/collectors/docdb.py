@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_docdb(session, cost_map):
-    doc = session.client("rds", region_name=REGION)
+    doc = get_client(session, "rds", region_name=REGION)
     rows = []
     clusters = safe_call(lambda: doc.describe_db_clusters().get("DBClusters", []), [])
     for c in clusters or []:
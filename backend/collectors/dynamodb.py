@@ -5,7 +5,7 @@ from datetime import datetime, timedelta, timezone
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
@@ -76,9 +76,9 @@ def _get_cloudwatch_sum_metric(cloudwatch, table_name: str, metric_name: str, da
 
 
 def collect_dynamodb(session, cost_map):
-    dynamodb = session.client("dynamodb", region_name=REGION)
-    cloudwatch = session.client("cloudwatch", region_name=REGION)
-    application_autoscaling = session.client("application-autoscaling", region_name=REGION)
+    dynamodb = get_client(session, "dynamodb", region_name=REGION)
+    cloudwatch = get_client(session, "cloudwatch", region_name=REGION)
+    application_autoscaling = get_client(session, "application-autoscaling", region_name=REGION)
     
     rows = []
     
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta, timezone
 
 import pandas as pd
 
-from aws_utils import get_instance_type_specs, safe_call
+from aws_utils import get_client, get_instance_type_specs, safe_call
 from config import REGION
 
 
@@ -16,7 +16,7 @@ def _fetch_ec2_cost_per_instance(session) -> dict[str, float]:
     """
     from datetime import date, timedelta as td
     try:
-        ce = session.client("ce", region_name="us-east-1")
+        ce = get_client(session, "ce", region_name="us-east-1")
         end_date = date.today()
         start_date = end_date - td(days=14)
         resp = ce.get_cost_and_usage_with_resources(
@@ -122,18 +122,18 @@ def _calculate_ec2_savings(current_cost: float, cpu_avg, optimization_status: st
 
 
 def collect_ec2(session, cost_map):
-    ec2 = session.client("ec2", region_name=REGION)
-    cloudwatch = session.client("cloudwatch", region_name=REGION)
+    ec2 = get_client(session, "ec2", region_name=REGION)
+    cloudwatch = get_client(session, "cloudwatch", region_name=REGION)
     try:
-        iam_client = session.client("iam")
+        iam_client = get_client(session, "iam")
     except Exception:
         iam_client = None
     try:
-        elbv2 = session.client("elbv2", region_name=REGION)
+        elbv2 = get_client(session, "elbv2", region_name=REGION)
     except Exception:
         elbv2 = None
     try:
-        elb_classic = session.client("elb", region_name=REGION)
+        elb_classic = get_client(session, "elb", region_name=REGION)
     except Exception:
         elb_classic = None
 
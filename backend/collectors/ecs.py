@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_ecs(session, cost_map) -> pd.DataFrame:
-    client = session.client("ecs", region_name=REGION)
+    client = get_client(session, "ecs", region_name=REGION)
     rows = []
 
     cluster_arns = safe_call(lambda: client.list_clusters().get("clusterArns", []), [])
@@ -3,14 +3,14 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import get_instance_type_specs, safe_call
+from aws_utils import get_client, get_instance_type_specs, safe_call
 from config import REGION
 
 
 def collect_eks(session, cost_map):
-    eks = session.client("eks", region_name=REGION)
-    ec2 = session.client("ec2", region_name=REGION)
-    cw = session.client("cloudwatch", region_name=REGION)
+    eks = get_client(session, "eks", region_name=REGION)
+    ec2 = get_client(session, "ec2", region_name=REGION)
+    cw = get_client(session, "cloudwatch", region_name=REGION)
     rows = []
     clusters = safe_call(lambda: eks.list_clusters().get("clusters", []), [])
     print(f"[DEBUG][EKS] Clusters found: {clusters}")
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import get_instance_type_specs, safe_call
+from aws_utils import get_client, get_instance_type_specs, safe_call
 from config import REGION
 
 
@@ -24,8 +24,8 @@ def collect_elasticache(session, cost_map):
         else:
             return "0 days"
 
-    ec = session.client("elasticache", region_name=REGION)
-    ec2 = session.client("ec2", region_name=REGION)
+    ec = get_client(session, "elasticache", region_name=REGION)
+    ec2 = get_client(session, "ec2", region_name=REGION)
     rows = []
     rep_groups = safe_call(lambda: ec.describe_replication_groups().get("ReplicationGroups", []), [])
     rep_group_map = {g["ReplicationGroupId"]: g for g in rep_groups}
@@ -126,7 +126,7 @@ def collect_elasticache(session, cost_map):
                 "BackupWindow": ""
             })
     try:
-        valkey = session.client("elasticache", region_name=REGION)
+        valkey = get_client(session, "elasticache", region_name=REGION)
         valkey_caches = safe_call(lambda: valkey.describe_serverless_caches().get("ServerlessCaches", []), [])
         for v in valkey_caches:
             rows.append({
@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_elasticbeanstalk(session, cost_map) -> pd.DataFrame:
-    client = session.client("elasticbeanstalk", region_name=REGION)
+    client = get_client(session, "elasticbeanstalk", region_name=REGION)
     rows = []
 
     apps = safe_call(lambda: client.describe_applications().get("Applications", []), [])
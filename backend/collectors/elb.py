@@ -8,14 +8,14 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 from datetime import datetime, timedelta, timezone
 
 
 def collect_elb(session, cost_map):
-    elb = session.client("elbv2", region_name=REGION)
-    cw = session.client("cloudwatch", region_name=REGION)
+    elb = get_client(session, "elbv2", region_name=REGION)
+    cw = get_client(session, "cloudwatch", region_name=REGION)
     rows = []
     lbs = safe_call(lambda: elb.describe_load_balancers().get("LoadBalancers", []), [])
     for lb in lbs or []:
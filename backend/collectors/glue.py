@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_glue(session, cost_map):
-    glue = session.client("glue", region_name=REGION)
+    glue = get_client(session, "glue", region_name=REGION)
     rows = []
     jobs = safe_call(lambda: glue.get_jobs().get("Jobs", []), [])
     for job in jobs or []:
@@ -4,9 +4,11 @@ from __future__ import annotations
 import pandas as pd
 from botocore.exceptions import ClientError
 
+from aws_utils import get_client
+
 
 def collect_iam(session, cost_map) -> pd.DataFrame:  # cost_map kept for signature compatibility
-    iam = session.client("iam")
+    iam = get_client(session, "iam")
     users: list[dict] = []
 
     paginator = iam.get_paginator("list_users")
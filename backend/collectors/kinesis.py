@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_kinesis(session, cost_map):
-    client = session.client("kinesis", region_name=REGION)
+    client = get_client(session, "kinesis", region_name=REGION)
     rows = []
     streams = safe_call(lambda: client.list_streams().get("StreamNames", []), [])
     for stream_name in streams or []:
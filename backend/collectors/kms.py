@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_kms(session, cost_map):
-    kms = session.client("kms", region_name=REGION)
+    kms = get_client(session, "kms", region_name=REGION)
     rows = []
     keys = safe_call(lambda: kms.list_keys().get("Keys", []), [])
     for key in keys or []:
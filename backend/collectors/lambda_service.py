@@ -8,7 +8,7 @@ from datetime import datetime, timedelta, timezone
 import pandas as pd
 from botocore.exceptions import ClientError
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 RETENTION_WINDOW_DAYS = 455
@@ -309,10 +309,10 @@ def _get_memory_recommendation(allocated_memory: int, max_memory_used: float) ->
 
 
 def collect_lambda(session, cost_map):
-    lam = session.client("lambda", region_name=REGION)
-    events = session.client("events", region_name=REGION)
-    cloudwatch = session.client("cloudwatch", region_name=REGION)
-    logs = session.client("logs", region_name=REGION)
+    lam = get_client(session, "lambda", region_name=REGION)
+    events = get_client(session, "events", region_name=REGION)
+    cloudwatch = get_client(session, "cloudwatch", region_name=REGION)
+    logs = get_client(session, "logs", region_name=REGION)
     rows = []
     paginator = lam.get_paginator("list_functions")
     for page in safe_call(lambda: paginator.paginate(), []):
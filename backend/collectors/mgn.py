@@ -3,16 +3,16 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages
 from config import REGION
 
 
 def collect_mgn(session, cost_map) -> pd.DataFrame:
-    client = session.client("mgn", region_name=REGION)
+    client = get_client(session, "mgn", region_name=REGION)
     rows = []
 
     paginator = client.get_paginator("describe_source_servers")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for server in page.get("items", []):
             lm = server.get("lifeCycle", {})
             data_rep = server.get("dataReplicationInfo", {})
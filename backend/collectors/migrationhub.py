@@ -3,18 +3,18 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages
 from config import REGION
 
 
 def collect_migrationhub(session, cost_map) -> pd.DataFrame:
     # Migration Hub is only available in us-east-1 and eu-central-1
-    client = session.client("mgh", region_name="us-east-1")
+    client = get_client(session, "mgh", region_name="us-east-1")
     rows = []
 
     # Migration tasks
     paginator = client.get_paginator("list_migration_tasks")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for task in page.get("MigrationTaskSummaryList", []):
             rows.append({
                 "ProgressUpdateStream": task.get("ProgressUpdateStream", ""),
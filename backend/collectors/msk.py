@@ -5,7 +5,7 @@ from datetime import datetime, timedelta, timezone
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
@@ -44,9 +44,9 @@ def _get_cloudwatch_avg_metric(cloudwatch, cluster_name: str, metric_name: str,
 
 
 def collect_msk(session, cost_map):
-    kafka = session.client("kafka", region_name=REGION)
-    cloudwatch = session.client("cloudwatch", region_name=REGION)
-    ec2 = session.client("ec2", region_name=REGION)
+    kafka = get_client(session, "kafka", region_name=REGION)
+    cloudwatch = get_client(session, "cloudwatch", region_name=REGION)
+    ec2 = get_client(session, "ec2", region_name=REGION)
     
     rows = []
     clusters = safe_call(lambda: kafka.list_clusters().get("ClusterInfoList", []), [])
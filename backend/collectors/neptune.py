@@ -3,18 +3,16 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages
 from config import REGION
 
 
 def collect_neptune(session, cost_map) -> pd.DataFrame:
-    client = session.client("neptune", region_name=REGION)
+    client = get_client(session, "neptune", region_name=REGION)
     rows = []
 
     paginator = client.get_paginator("describe_db_clusters")
-    for page in safe_call(lambda: list(paginator.paginate(
-        Filters=[{"Name": "engine", "Values": ["neptune"]}]
-    )), []) or []:
+    for page in iter_pages(paginator, Filters=[{"Name": "engine", "Values": ["neptune"]}]):
         for cluster in page.get("DBClusters", []):
             members = cluster.get("DBClusterMembers", [])
             instance_ids = ", ".join(m.get("DBInstanceIdentifier", "") for m in members)
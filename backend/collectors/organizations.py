@@ -3,13 +3,13 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages, safe_call
 from config import REGION
 
 
 def collect_organizations(session, cost_map) -> pd.DataFrame:
     # Organizations API is global, use us-east-1
-    client = session.client("organizations", region_name="us-east-1")
+    client = get_client(session, "organizations", region_name="us-east-1")
     rows = []
 
     org = safe_call(lambda: client.describe_organization().get("Organization", {}), {})
@@ -18,7 +18,7 @@ def collect_organizations(session, cost_map) -> pd.DataFrame:
 
     # Accounts
     paginator = client.get_paginator("list_accounts")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for acct in page.get("Accounts", []):
             rows.append({
                 "AccountId": acct.get("Id", ""),
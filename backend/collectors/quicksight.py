@@ -3,18 +3,17 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_account_id, get_client, safe_call
 from config import REGION
 
 
 def collect_quicksight(session, cost_map) -> pd.DataFrame:
     # QuickSight requires an AWS account ID
-    sts = session.client("sts")
-    account_id = safe_call(lambda: sts.get_caller_identity().get("Account", ""), "")
+    account_id = get_account_id(session)
     if not account_id:
         return pd.DataFrame()
 
-    client = session.client("quicksight", region_name=REGION)
+    client = get_client(session, "quicksight", region_name=REGION)
     rows = []
 
     # Dashboards
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta, timezone
 
 import pandas as pd
 
-from aws_utils import get_instance_type_specs, safe_call
+from aws_utils import get_client, get_instance_type_specs, safe_call
 from config import REGION
 
 
@@ -103,7 +103,7 @@ def _fetch_rds_cost_per_instance(session) -> dict[str, float]:
     """
     from datetime import date, timedelta as td
     try:
-        ce = session.client("ce", region_name="us-east-1")
+        ce = get_client(session, "ce", region_name="us-east-1")
         end_date = date.today()
         start_date = end_date - td(days=14)
         start_str = start_date.strftime("%Y-%m-%d")
@@ -164,10 +164,10 @@ def _calculate_rds_savings(current_cost: float, load_vs_vcpu_percent: float | No
 
 
 def collect_rds(session, cost_map):
-    rds = session.client("rds", region_name=REGION)
-    ec2 = session.client("ec2", region_name=REGION)
-    cloudwatch = session.client("cloudwatch", region_name=REGION)
-    pi_client = session.client("pi", region_name=REGION)
+    rds = get_client(session, "rds", region_name=REGION)
+    ec2 = get_client(session, "ec2", region_name=REGION)
+    cloudwatch = get_client(session, "cloudwatch", region_name=REGION)
+    pi_client = get_client(session, "pi", region_name=REGION)
 
     # Fetch real per-instance costs from Cost Explorer (Approach B)
     rds_instance_costs = _fetch_rds_cost_per_instance(session)
@@ -3,11 +3,11 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 
 
 def collect_route53(session, cost_map):
-    r53 = session.client("route53")
+    r53 = get_client(session, "route53")
     rows = []
     hosted_zones = safe_call(lambda: r53.list_hosted_zones().get("HostedZones", []), [])
     for zone in hosted_zones or []:
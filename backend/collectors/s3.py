@@ -5,85 +5,95 @@ import datetime
 
 import pandas as pd
 
-from aws_utils import format_bytes_to_gb, safe_call
+from aws_utils import format_bytes_to_gb, get_client, iter_pages, map_concurrently, safe_call
 from config import REGION
 
 
-def collect_s3(session, cost_map):
-    cw = session.client("cloudwatch", region_name=REGION)
-    s3 = session.client("s3", region_name=REGION)
-    rows = []
-    buckets = safe_call(lambda: s3.list_buckets().get("Buckets", []), [])
-    for bucket in buckets or []:
-        name = bucket.get("Name")
-        size_bytes = None
-        obj_count = None
-        try:
-            size_metrics = cw.get_metric_statistics(
-                Namespace="AWS/S3",
-                MetricName="BucketSizeBytes",
-                Dimensions=[
-                    {"Name": "BucketName", "Value": name},
-                    {"Name": "StorageType", "Value": "StandardStorage"},
-                ],
-                StartTime=datetime.datetime.utcnow() - datetime.timedelta(days=14),
-                EndTime=datetime.datetime.utcnow(),
-                Period=86400,
-                Statistics=["Average"],
-            )
-            datapoints = size_metrics.get("Datapoints", [])
-            if datapoints:
-                size_bytes = sorted(datapoints, key=lambda x: x["Timestamp"], reverse=True)[0]["Average"]
-        except Exception as exc:
-            print(f"  ⚠ S3 CloudWatch size metric error for {name}: {exc}")
-        try:
-            obj_metrics = cw.get_metric_statistics(
-                Namespace="AWS/S3",
-                MetricName="NumberOfObjects",
-                Dimensions=[
-                    {"Name": "BucketName", "Value": name},
-                    {"Name": "StorageType", "Value": "AllStorageTypes"},
-                ],
-                StartTime=datetime.datetime.utcnow() - datetime.timedelta(days=14),
-                EndTime=datetime.datetime.utcnow(),
-                Period=86400,
-                Statistics=["Average"],
-            )
-            datapoints = obj_metrics.get("Datapoints", [])
-            if datapoints:
-                obj_count = int(round(sorted(datapoints, key=lambda x: x["Timestamp"], reverse=True)[0]["Average"]))
-        except Exception as exc:
-            print(f"  ⚠ S3 CloudWatch object count metric error for {name}: {exc}")
-        try:
-            versioning = s3.get_bucket_versioning(Bucket=name)
-            versioning_status = versioning.get("Status", "Disabled")
-        except Exception as exc:
-            print(f"  ⚠ S3 versioning access error for {name}: {exc}")
-            versioning_status = "Error"
-
-        public_block_config = safe_call(
-            lambda: s3.get_public_access_block(Bucket=name).get("PublicAccessBlockConfiguration"),
-            None,
+def _describe_bucket(cw, s3, bucket, start_time, end_time) -> dict:
+    name = bucket.get("Name")
+    size_bytes = None
+    obj_count = None
+    try:
+        size_metrics = cw.get_metric_statistics(
+            Namespace="AWS/S3",
+            MetricName="BucketSizeBytes",
+            Dimensions=[
+                {"Name": "BucketName", "Value": name},
+                {"Name": "StorageType", "Value": "StandardStorage"},
+            ],
+            StartTime=start_time,
+            EndTime=end_time,
+            Period=86400,
+            Statistics=["Average"],
         )
-        if public_block_config is None:
-            block_all_public_access = "Unknown"
-        else:
-            flags = [
-                public_block_config.get("BlockPublicAcls", False),
-                public_block_config.get("IgnorePublicAcls", False),
-                public_block_config.get("BlockPublicPolicy", False),
-                public_block_config.get("RestrictPublicBuckets", False),
-            ]
-            block_all_public_access = "ON" if all(flags) else "OFF"
-        rows.append(
-            {
-                "BucketName": name,
-                "SizeGB": format_bytes_to_gb(size_bytes) if size_bytes is not None else None,
-                "ObjectCount": obj_count,
-                "Versioning": versioning_status,
-                "BlockAllPublicAccess": block_all_public_access,
-            }
+        datapoints = size_metrics.get("Datapoints", [])
+        if datapoints:
+            size_bytes = sorted(datapoints, key=lambda x: x["Timestamp"], reverse=True)[0]["Average"]
+    except Exception as exc:
+        print(f"  ⚠ S3 CloudWatch size metric error for {name}: {exc}")
+    try:
+        obj_metrics = cw.get_metric_statistics(
+            Namespace="AWS/S3",
+            MetricName="NumberOfObjects",
+            Dimensions=[
+                {"Name": "BucketName", "Value": name},
+                {"Name": "StorageType", "Value": "AllStorageTypes"},
+            ],
+            StartTime=start_time,
+            EndTime=end_time,
+            Period=86400,
+            Statistics=["Average"],
+        )
+        datapoints = obj_metrics.get("Datapoints", [])
+        if datapoints:
+            obj_count = int(round(sorted(datapoints, key=lambda x: x["Timestamp"], reverse=True)[0]["Average"]))
+    except Exception as exc:
+        print(f"  ⚠ S3 CloudWatch object count metric error for {name}: {exc}")
+    try:
+        versioning = s3.get_bucket_versioning(Bucket=name)
+        versioning_status = versioning.get("Status", "Disabled")
+    except Exception as exc:
+        print(f"  ⚠ S3 versioning access error for {name}: {exc}")
+        versioning_status = "Error"
+
+    public_block_config = safe_call(
+        lambda: s3.get_public_access_block(Bucket=name).get("PublicAccessBlockConfiguration"),
+        None,
+    )
+    if public_block_config is None:
+        block_all_public_access = "Unknown"
+    else:
+        flags = [
+            public_block_config.get("BlockPublicAcls", False),
+            public_block_config.get("IgnorePublicAcls", False),
+            public_block_config.get("BlockPublicPolicy", False),
+            public_block_config.get("RestrictPublicBuckets", False),
+        ]
+        block_all_public_access = "ON" if all(flags) else "OFF"
+    return {
+        "BucketName": name,
+        "SizeGB": format_bytes_to_gb(size_bytes) if size_bytes is not None else None,
+        "ObjectCount": obj_count,
+        "Versioning": versioning_status,
+        "BlockAllPublicAccess": block_all_public_access,
+    }
+
+
+def collect_s3(session, cost_map):
+    cw = get_client(session, "cloudwatch", region_name=REGION)
+    s3 = get_client(session, "s3", region_name=REGION)
+    if s3.can_paginate("list_buckets"):
+        buckets = (
+            bucket
+            for page in iter_pages(s3.get_paginator("list_buckets"))
+            for bucket in page.get("Buckets", [])
         )
+    else:  # botocore releases without the ListBuckets paginator
+        buckets = safe_call(lambda: s3.list_buckets().get("Buckets", []), []) or []
+    end_time = datetime.datetime.utcnow()
+    start_time = end_time - datetime.timedelta(days=14)
+    # Four independent metric/config lookups per bucket; run buckets concurrently.
+    rows = map_concurrently(lambda b: _describe_bucket(cw, s3, b, start_time, end_time), buckets)
     df = pd.DataFrame(rows)
     if not df.empty and "ObjectCount" in df.columns:
         df["ObjectCount"] = df["ObjectCount"].apply(lambda value: int(value) if pd.notnull(value) else "")
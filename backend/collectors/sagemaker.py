@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
@@ -25,7 +25,7 @@ def _list_all(fetch_page, items_key: str) -> list[dict]:
 
 
 def collect_sagemaker(session, cost_map):
-    sm = session.client("sagemaker", region_name=REGION)
+    sm = get_client(session, "sagemaker", region_name=REGION)
     rows: list[dict] = []
 
     # Notebook Instances
@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_savingsplans(session, cost_map) -> pd.DataFrame:
-    client = session.client("savingsplans", region_name="us-east-1")
+    client = get_client(session, "savingsplans", region_name="us-east-1")
     rows = []
 
     plans = safe_call(
@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_secrets(session, cost_map):
-    sm = session.client("secretsmanager", region_name=REGION)
+    sm = get_client(session, "secretsmanager", region_name=REGION)
     rows = []
     paginator = sm.get_paginator("list_secrets")
     for page in safe_call(lambda: paginator.paginate(), []):
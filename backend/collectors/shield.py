@@ -3,13 +3,13 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages, safe_call
 from config import REGION
 
 
 def collect_shield(session, cost_map) -> pd.DataFrame:
     # Shield is global (us-east-1)
-    client = session.client("shield", region_name="us-east-1")
+    client = get_client(session, "shield", region_name="us-east-1")
     rows = []
 
     # Check subscription
@@ -29,7 +29,7 @@ def collect_shield(session, cost_map) -> pd.DataFrame:
 
     # Protections
     paginator = client.get_paginator("list_protections")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for prot in page.get("Protections", []):
             rows.append({
                 "ResourceType": "Protection",
@@ -3,33 +3,56 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages
 from config import REGION
 
+# (output column, describe_snapshots key) for fields copied straight through.
+_SNAPSHOT_FIELDS = (
+    ("SnapshotId", "SnapshotId"),
+    ("VolumeId", "VolumeId"),
+    ("VolumeSize(GiB)", "VolumeSize"),
+    ("State", "State"),
+    ("Encrypted", "Encrypted"),
+    ("KmsKeyId", "KmsKeyId"),
+    ("OwnerId", "OwnerId"),
+    ("Description", "Description"),
+    ("Progress", "Progress"),
+    ("StorageTier", "StorageTier"),
+)
+
+_COLUMNS = (
+    "SnapshotId",
+    "Name",
+    "VolumeId",
+    "VolumeSize(GiB)",
+    "State",
+    "Encrypted",
+    "KmsKeyId",
+    "OwnerId",
+    "Description",
+    "Progress",
+    "StorageTier",
+    "RestoreExpiryTime",
+    "StartTime",
+    "Tags",
+)
+
+
+def _row_from_snapshot(snap: dict) -> dict:
+    tags = {t["Key"]: t["Value"] for t in (snap.get("Tags") or [])}
+    row = {column: snap.get(key, "") for column, key in _SNAPSHOT_FIELDS}
+    row["Name"] = tags.get("Name", "")
+    row["RestoreExpiryTime"] = str(snap.get("RestoreExpiryTime", "") or "")
+    row["StartTime"] = str(snap.get("StartTime", "") or "")
+    row["Tags"] = ", ".join(f"{k}={v}" for k, v in tags.items())
+    return row
+
 
 def collect_snapshots(session, cost_map) -> pd.DataFrame:
-    client = session.client("ec2", region_name=REGION)
-    rows = []
+    client = get_client(session, "ec2", region_name=REGION)
 
     paginator = client.get_paginator("describe_snapshots")
-    for page in safe_call(lambda: list(paginator.paginate(OwnerIds=["self"])), []) or []:
-        for snap in page.get("Snapshots", []):
-            tags = {t["Key"]: t["Value"] for t in (snap.get("Tags") or [])}
-            rows.append({
-                "SnapshotId": snap.get("SnapshotId", ""),
-                "Name": tags.get("Name", ""),
-                "VolumeId": snap.get("VolumeId", ""),
-                "VolumeSize(GiB)": snap.get("VolumeSize", ""),
-                "State": snap.get("State", ""),
-                "Encrypted": snap.get("Encrypted", ""),
-                "KmsKeyId": snap.get("KmsKeyId", ""),
-                "OwnerId": snap.get("OwnerId", ""),
-                "Description": snap.get("Description", ""),
-                "Progress": snap.get("Progress", ""),
-                "StorageTier": snap.get("StorageTier", ""),
-                "RestoreExpiryTime": str(snap.get("RestoreExpiryTime", "") or ""),
-                "StartTime": str(snap.get("StartTime", "") or ""),
-                "Tags": ", ".join(f"{k}={v}" for k, v in tags.items()),
-            })
-
-    return pd.DataFrame(rows)
+    pages = iter_pages(paginator, OwnerIds=["self"], PaginationConfig={"PageSize": 1000})
+    rows = [_row_from_snapshot(snap) for page in pages for snap in page.get("Snapshots", [])]
+
+    return pd.DataFrame(rows, columns=_COLUMNS)
@@ -3,16 +3,16 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages
 from config import REGION
 
 
 def collect_snowball(session, cost_map) -> pd.DataFrame:
-    client = session.client("snowball", region_name=REGION)
+    client = get_client(session, "snowball", region_name=REGION)
     rows = []
 
     paginator = client.get_paginator("list_jobs")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for job in page.get("JobListEntries", []):
             rows.append({
                 "JobId": job.get("JobId", ""),
@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_sns(session, cost_map):
-    sns = session.client("sns", region_name=REGION)
+    sns = get_client(session, "sns", region_name=REGION)
     rows = []
     topics = safe_call(lambda: sns.list_topics().get("Topics", []), [])
     for topic in topics or []:
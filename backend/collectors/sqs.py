@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
 
 def collect_sqs(session, cost_map):
-    sqs = session.client("sqs", region_name=REGION)
+    sqs = get_client(session, "sqs", region_name=REGION)
     rows = []
     queue_urls = safe_call(lambda: sqs.list_queues().get("QueueUrls", []), [])
     for url in queue_urls or []:
@@ -3,18 +3,18 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages, safe_call
 from config import REGION
 
 
 def collect_ssm(session, cost_map) -> pd.DataFrame:
-    client = session.client("ssm", region_name=REGION)
+    client = get_client(session, "ssm", region_name=REGION)
     rows = []
 
     # Managed instances
     paginator_instances = client.get_paginator("describe_instance_information")
     instances = []
-    for page in safe_call(lambda: list(paginator_instances.paginate()), []) or []:
+    for page in iter_pages(paginator_instances):
         instances.extend(page.get("InstanceInformationList", []))
 
     for inst in instances:
@@ -3,16 +3,16 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages, safe_call
 from config import REGION
 
 
 def collect_stepfunctions(session, cost_map) -> pd.DataFrame:
-    client = session.client("stepfunctions", region_name=REGION)
+    client = get_client(session, "stepfunctions", region_name=REGION)
     rows = []
 
     paginator = client.get_paginator("list_state_machines")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for sm in page.get("stateMachines", []):
             arn = sm.get("stateMachineArn", "")
             detail = safe_call(lambda a=arn: client.describe_state_machine(stateMachineArn=a), {})
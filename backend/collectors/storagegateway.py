@@ -3,21 +3,38 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, map_concurrently, safe_call
 from config import REGION
 
+_COLUMNS = (
+    "GatewayId",
+    "GatewayARN",
+    "GatewayName",
+    "GatewayType",
+    "GatewayState",
+    "GatewayTimezone",
+    "Ec2InstanceId",
+    "Ec2InstanceRegion",
+    "HostEnvironment",
+    "LastSoftwareUpdate",
+    "SoftwareUpdatesEndDate",
+    "Tags",
+)
+
 
 def collect_storagegateway(session, cost_map) -> pd.DataFrame:
-    client = session.client("storagegateway", region_name=REGION)
+    client = get_client(session, "storagegateway", region_name=REGION)
     rows = []
 
-    gateways = safe_call(lambda: client.list_gateways().get("Gateways", []), [])
-    for gw in gateways or []:
+    gateways = safe_call(lambda: client.list_gateways().get("Gateways", []), []) or []
+    details = map_concurrently(
+        lambda gw: safe_call(
+            lambda: client.describe_gateway_information(GatewayARN=gw.get("GatewayARN", "")), {}
+        ),
+        gateways,
+    )
+    for gw, detail in zip(gateways, details):
         gw_arn = gw.get("GatewayARN", "")
-        detail = safe_call(
-            lambda a=gw_arn: client.describe_gateway_information(GatewayARN=a), {}
-        )
-        tags = {t["Key"]: t["Value"] for t in (detail.get("Tags") or [])}
         rows.append({
             "GatewayId": gw.get("GatewayId", ""),
             "GatewayARN": gw_arn,
@@ -30,7 +47,7 @@ def collect_storagegateway(session, cost_map) -> pd.DataFrame:
             "HostEnvironment": detail.get("HostEnvironment", ""),
             "LastSoftwareUpdate": detail.get("LastSoftwareUpdate", ""),
             "SoftwareUpdatesEndDate": detail.get("SoftwareUpdatesEndDate", ""),
-            "Tags": ", ".join(f"{k}={v}" for k, v in tags.items()),
+            "Tags": ", ".join(f'{t["Key"]}={t["Value"]}' for t in (detail.get("Tags") or [])),
         })
 
-    return pd.DataFrame(rows)
+    return pd.DataFrame(rows, columns=_COLUMNS)
@@ -3,12 +3,21 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
+_COLUMNS = (
+    "JobId",
+    "JobTag",
+    "Status",
+    "CreationTime",
+    "CompletionTime",
+    "DocumentLocation",
+)
+
 
 def collect_textract(session, cost_map) -> pd.DataFrame:
-    client = session.client("textract", region_name=REGION)
+    client = get_client(session, "textract", region_name=REGION)
     rows = []
 
     jobs = safe_call(lambda: client.list_document_text_detection_jobs().get("DocumentTextDetectionJobSummaryList", []), [])
@@ -22,4 +31,4 @@ def collect_textract(session, cost_map) -> pd.DataFrame:
             "DocumentLocation": str(job.get("DocumentLocation", {}).get("S3Object", {}).get("Name", "")),
         })
 
-    return pd.DataFrame(rows)
+    return pd.DataFrame(rows, columns=_COLUMNS)
@@ -3,34 +3,54 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages, map_concurrently, safe_call
 from config import REGION
 
+_COLUMNS = (
+    "ServerId",
+    "Arn",
+    "Domain",
+    "State",
+    "EndpointType",
+    "Protocols",
+    "IdentityProviderType",
+    "LoggingRole",
+    "UserCount",
+    "CreatedDateTime",
+    "Tags",
+)
+
 
 def collect_transfer(session, cost_map) -> pd.DataFrame:
-    client = session.client("transfer", region_name=REGION)
+    client = get_client(session, "transfer", region_name=REGION)
     rows = []
 
     paginator = client.get_paginator("list_servers")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
-        for server in page.get("Servers", []):
-            server_id = server.get("ServerId", "")
-            detail = safe_call(
-                lambda sid=server_id: client.describe_server(ServerId=sid).get("Server", {}), {}
-            )
-            tags = {t["Key"]: t["Value"] for t in (detail.get("Tags") or [])}
-            rows.append({
-                "ServerId": server_id,
-                "Arn": server.get("Arn", ""),
-                "Domain": server.get("Domain", ""),
-                "State": server.get("State", ""),
-                "EndpointType": detail.get("EndpointType", ""),
-                "Protocols": ", ".join(detail.get("Protocols", [])),
-                "IdentityProviderType": detail.get("IdentityProviderType", ""),
-                "LoggingRole": detail.get("LoggingRole", ""),
-                "UserCount": server.get("UserCount", ""),
-                "CreatedDateTime": str(server.get("CreatedDateTime", "") or ""),
-                "Tags": ", ".join(f"{k}={v}" for k, v in tags.items()),
-            })
+    servers = [
+        server
+        for page in iter_pages(paginator)
+        for server in page.get("Servers", [])
+    ]
+    details = map_concurrently(
+        lambda server: safe_call(
+            lambda: client.describe_server(ServerId=server.get("ServerId", "")).get("Server", {}), {}
+        ),
+        servers,
+    )
+    for server, detail in zip(servers, details):
+        server_id = server.get("ServerId", "")
+        rows.append({
+            "ServerId": server_id,
+            "Arn": server.get("Arn", ""),
+            "Domain": server.get("Domain", ""),
+            "State": server.get("State", ""),
+            "EndpointType": detail.get("EndpointType", ""),
+            "Protocols": ", ".join(detail.get("Protocols", [])),
+            "IdentityProviderType": detail.get("IdentityProviderType", ""),
+            "LoggingRole": detail.get("LoggingRole", ""),
+            "UserCount": server.get("UserCount", ""),
+            "CreatedDateTime": str(server.get("CreatedDateTime", "") or ""),
+            "Tags": ", ".join(f'{t["Key"]}={t["Value"]}' for t in (detail.get("Tags") or [])),
+        })
 
-    return pd.DataFrame(rows)
+    return pd.DataFrame(rows, columns=_COLUMNS)
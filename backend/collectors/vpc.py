@@ -1,34 +1,49 @@
 """Amazon VPC collectors."""
 from __future__ import annotations
 
+import re
+from collections import defaultdict
+
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages, safe_call
 from config import REGION
 
+# VPCs provisioned by AWS Control Tower are excluded from the inventory.
+_CONTROL_TOWER_RE = re.compile("aws-controltower", re.IGNORECASE)
+
+_COLUMNS = (
+    "VPC Name",
+    "VpcId",
+    "CIDRs",
+    "IsDefault",
+    "SubnetId",
+    "SubnetCIDR",
+    "AvailabilityZone",
+)
+
 
 def collect_vpc(session, cost_map):
-    ec2 = session.client("ec2", region_name=REGION)
+    ec2 = get_client(session, "ec2", region_name=REGION)
     rows = []
     vpcs = safe_call(lambda: ec2.describe_vpcs().get("Vpcs", []), [])
+    # One paginated describe_subnets for the region, grouped by VPC locally.
+    subnets_by_vpc = defaultdict(list)
+    for page in iter_pages(ec2.get_paginator("describe_subnets")):
+        for subnet in page.get("Subnets", []):
+            subnets_by_vpc[subnet.get("VpcId")].append(subnet)
     for vpc in vpcs or []:
         vpc_id = vpc.get("VpcId")
-        cidr_blocks = [assoc.get("CidrBlock") for assoc in vpc.get("CidrBlockAssociationSet", []) if assoc.get("CidrBlock")]
-        cidrs = "\n".join(cidr_blocks) if cidr_blocks else None
+        cidrs = "\n".join(
+            assoc["CidrBlock"] for assoc in vpc.get("CidrBlockAssociationSet", []) if assoc.get("CidrBlock")
+        ) or None
         is_default = vpc.get("IsDefault")
-        name = ""
-        for tag in vpc.get("Tags", []) or []:
-            if tag.get("Key") == "Name":
-                name = tag.get("Value", "")
-                break
-        if name and "aws-controltower" in name.lower():
+        name = next((tag.get("Value", "") for tag in (vpc.get("Tags") or []) if tag.get("Key") == "Name"), "")
+        if name and _CONTROL_TOWER_RE.search(name):
             continue
-        subnets = safe_call(
-            lambda: ec2.describe_subnets(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]).get("Subnets", []),
-            [],
-        )
+        subnets = subnets_by_vpc.get(vpc_id, [])
         first = True
-        for subnet in subnets or []:
+        for subnet in subnets:
             rows.append(
                 {
                     "VPC Name": name if first else "",
@@ -53,4 +68,4 @@ def collect_vpc(session, cost_map):
                     "AvailabilityZone": None,
                 }
             )
-    return pd.DataFrame(rows)
+    return pd.DataFrame(rows, columns=_COLUMNS)
@@ -3,18 +3,33 @@ from __future__ import annotations
 
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, iter_pages
 from config import REGION
 
+_COLUMNS = (
+    "VpcPeeringConnectionId",
+    "Status",
+    "StatusMessage",
+    "RequesterVpcId",
+    "RequesterOwnerId",
+    "RequesterRegion",
+    "RequesterCidrBlock",
+    "AccepterVpcId",
+    "AccepterOwnerId",
+    "AccepterRegion",
+    "AccepterCidrBlock",
+    "ExpirationTime",
+    "Tags",
+)
+
 
 def collect_vpcpeering(session, cost_map) -> pd.DataFrame:
-    client = session.client("ec2", region_name=REGION)
+    client = get_client(session, "ec2", region_name=REGION)
     rows = []
 
     paginator = client.get_paginator("describe_vpc_peering_connections")
-    for page in safe_call(lambda: list(paginator.paginate()), []) or []:
+    for page in iter_pages(paginator):
         for conn in page.get("VpcPeeringConnections", []):
-            tags = {t["Key"]: t["Value"] for t in (conn.get("Tags") or [])}
             req = conn.get("RequesterVpcInfo", {})
             acc = conn.get("AccepterVpcInfo", {})
             rows.append({
@@ -30,7 +45,7 @@ def collect_vpcpeering(session, cost_map) -> pd.DataFrame:
                 "AccepterRegion": acc.get("Region", ""),
                 "AccepterCidrBlock": acc.get("CidrBlock", ""),
                 "ExpirationTime": str(conn.get("ExpirationTime", "") or ""),
-                "Tags": ", ".join(f"{k}={v}" for k, v in tags.items()),
+                "Tags": ", ".join(f'{t["Key"]}={t["Value"]}' for t in (conn.get("Tags") or [])),
             })
 
-    return pd.DataFrame(rows)
+    return pd.DataFrame(rows, columns=_COLUMNS)
@@ -1,19 +1,41 @@
 """AWS WAF collectors."""
 from __future__ import annotations
 
+import time
+import weakref
+
 import pandas as pd
 
-from aws_utils import safe_call
+from aws_utils import get_client, safe_call
 from config import REGION
 
+_COLUMNS = (
+    "WebACLId",
+    "Name",
+)
+
+# WAF Classic is a global endpoint, so every region pass of a profile gets the
+# same listing; keep it per session instead of re-listing for each region.
+# Sessions live for the whole process, so a listing expires after the TTL and
+# the next scan sees current web ACLs.
+WEB_ACLS_TTL_SECONDS = 300
+_WEB_ACLS = weakref.WeakKeyDictionary()  # session -> (monotonic time, listing)
+
 
 def collect_waf(session, cost_map):
-    waf = session.client("waf", region_name=REGION)
+    cached = _WEB_ACLS.get(session)
+    if cached is not None and time.monotonic() - cached[0] < WEB_ACLS_TTL_SECONDS:
+        web_acls = cached[1]
+    else:
+        waf = get_client(session, "waf", region_name=REGION)
+        web_acls = safe_call(lambda: waf.list_web_acls().get("WebACLs", []), None)
+        if web_acls is None:
+            return pd.DataFrame(columns=_COLUMNS)
+        _WEB_ACLS[session] = (time.monotonic(), web_acls)
     rows = []
-    web_acls = safe_call(lambda: waf.list_web_acls().get("WebACLs", []), [])
-    for acl in web_acls or []:
+    for acl in web_acls:
         rows.append({
             "WebACLId": acl.get("WebACLId"),
             "Name": acl.get("Name"),
         })
-    return pd.DataFrame(rows)
+    return pd.DataFrame(rows, columns=_COLUMNS)
@@ -1,16 +1,16 @@
 """Project-wide constants and shared configuration values."""
 from __future__ import annotations
 
+import functools
 import os
-from typing import Any, Callable, List
-
-import boto3
+from typing import Any, Callable, FrozenSet, List, Tuple
 
 REGION = "ap-south-1"
 
 # Project root = parent of this file's directory (backend/ -> project root)
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 OUTPUT_BASE_DIR = os.path.join(_PROJECT_ROOT, "Data")
+CONFIG_DIR = os.path.join(_PROJECT_ROOT, "config")
 
 # Legacy aliases kept for any third-party scripts that still import them.
 EXCEL_OUTPUT_DIR = os.path.join(OUTPUT_BASE_DIR, "Excel")
@@ -18,19 +18,50 @@ CSV_OUTPUT_DIR = os.path.join(OUTPUT_BASE_DIR, "CSV")
 COMBINED_EXCEL_PATH = os.path.join(OUTPUT_BASE_DIR, "AWS_SERVICES.xlsx")
 
 
-def get_account_region_dir(account_name: str, region: str) -> str:
-    """Return (and create) the canonical output directory for an account+region.
+# filename -> ((st_mtime_ns, st_size), parsed mapping)
+_YAML_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
 
-    Path: ``Data/{account_name}/{region}/``
+
+def load_config_yaml(filename: str) -> dict:
+    """Parse ``config/{filename}`` and return its mapping.
+
+    The parsed result is reused until the file's mtime or size changes, so
+    long-running processes pick up edits without re-parsing on every call.
+    The result is shared between callers, so treat it as read-only.
     """
+    path = os.path.join(CONFIG_DIR, filename)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(filename)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    import yaml  # type: ignore
+    # One read of the whole file; libyaml scans a single bytes buffer fastest.
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = yaml.load(raw, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
+    _YAML_CACHE[filename] = (stamp, data)
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def _account_region_path(account_name: str, region: str) -> str:
     from aws_utils import sanitize_filename  # local import to avoid circular
     safe_account = sanitize_filename(account_name.replace(" ", "_"))[:80]
     safe_region = sanitize_filename(region)
-    path = os.path.join(OUTPUT_BASE_DIR, safe_account, safe_region)
+    return os.path.join(OUTPUT_BASE_DIR, safe_account, safe_region)
+
+
+def get_account_region_dir(account_name: str, region: str) -> str:
+    """Return (and create) the canonical output directory for an account+region.
+
+    Path: ``Data/{account_name}/{region}/``
+    """
+    path = _account_region_path(account_name, region)
     os.makedirs(path, exist_ok=True)
     return path
 
-PROFILE_SERVICES: List[str] = [
+PROFILE_SERVICES: Tuple[str, ...] = (
     "RDS",
     "CloudWatchAlarm",
     "CloudWatchLogs",
@@ -58,7 +89,10 @@ PROFILE_SERVICES: List[str] = [
     "MSK",
     "DynamoDB",
     "SageMaker",
-]
+)
+
+# Membership view of PROFILE_SERVICES; keep the tuple for ordered iteration.
+PROFILE_SERVICES_SET: FrozenSet[str] = frozenset(PROFILE_SERVICES)
 
 
 def safe_call(fn: Callable[[], Any], default: Any = None) -> Any:
@@ -71,6 +105,7 @@ def safe_call(fn: Callable[[], Any], default: Any = None) -> Any:
 
 def get_available_profiles() -> List[str]:
     try:
+        import boto3  # deferred: config is imported by code that never touches AWS
         session = boto3.Session()
         return session.available_profiles or []
     except Exception:
@@ -79,8 +114,11 @@ def get_available_profiles() -> List[str]:
 
 def get_account_display_name(profile: str, session=None) -> str:
     try:
-        session = session or boto3.Session(profile_name=profile, region_name=REGION)
-        iam = session.client("iam")
+        if session is None:
+            import boto3
+            session = boto3.Session(profile_name=profile, region_name=REGION)
+        from aws_utils import get_client  # local import to avoid circular
+        iam = get_client(session, "iam")
         aliases: List[str] = safe_call(lambda: iam.list_account_aliases().get("AccountAliases", []), []) or []
         if aliases:
             return aliases[0]
@@ -4,7 +4,7 @@ from __future__ import annotations
 from .csv_export import export_workbook_sheets_to_csv
 from .post_process import post_process_workbook, post_process_workbook_file
 from .profile_runner import run_for_profile, run_for_profile_compat
-from .utils import format_cell_value, is_cluster_column, normalize_for_csv
+from .utils import format_cell_value, format_column, format_frame, is_cluster_column, normalize_for_csv
 
 __all__ = [
     "export_workbook_sheets_to_csv",
@@ -13,6 +13,8 @@ __all__ = [
     "run_for_profile",
     "run_for_profile_compat",
     "format_cell_value",
+    "format_column",
+    "format_frame",
     "is_cluster_column",
     "normalize_for_csv",
 ]
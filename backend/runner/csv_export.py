@@ -1,30 +1,50 @@
 """CSV export utilities for workbook outputs."""
 from __future__ import annotations
 
+import csv
 import os
 
-import pandas as pd
-
 from aws_utils import sanitize_filename
 
 
+def _write_sheet_csv(worksheet, csv_path: str) -> bool:
+    """Stream one worksheet to ``csv_path``; return False if it had no data.
+
+    Rows are padded to ``worksheet.max_column`` as they stream. Blank rows are
+    held back and written only when a later row has data, so trailing blank
+    rows are dropped without buffering the sheet. The file is opened on the
+    first non-blank row, so empty sheets leave nothing behind.
+    """
+    max_columns = worksheet.max_column
+    handle = None
+    writer = None
+    pending_blank: list[list] = []
+    try:
+        for row in worksheet.iter_rows(values_only=True):
+            values = ["" if cell is None else cell for cell in row]
+            if len(values) < max_columns:
+                values += [""] * (max_columns - len(values))
+            if all(cell == "" for cell in values):
+                pending_blank.append(values)
+                continue
+            if writer is None:
+                # Line endings match pandas' to_csv default used previously.
+                handle = open(csv_path, "w", newline="", encoding="utf-8")
+                writer = csv.writer(handle, lineterminator=os.linesep)
+            if pending_blank:
+                writer.writerows(pending_blank)
+                pending_blank.clear()
+            writer.writerow(values)
+    finally:
+        if handle is not None:
+            handle.close()
+    return writer is not None
+
+
 def export_workbook_sheets_to_csv(workbook, csv_dir: str) -> None:
     os.makedirs(csv_dir, exist_ok=True)
     for worksheet in workbook.worksheets:
-        rows = []
-        max_columns = 0
-        for row in worksheet.iter_rows(values_only=True):
-            values = ["" if cell is None else cell for cell in row]
-            rows.append(values)
-            if len(values) > max_columns:
-                max_columns = len(values)
-        while rows and all(cell == "" for cell in rows[-1]):
-            rows.pop()
-        if not rows or max_columns == 0:
-            continue
-        padded = [row + ["" for _ in range(max_columns - len(row))] for row in rows]
-        dataframe = pd.DataFrame(padded)
         safe_title = sanitize_filename(worksheet.title)
         csv_path = os.path.join(csv_dir, f"{safe_title}.csv")
-        dataframe.to_csv(csv_path, index=False, header=False)
-        print(f"Wrote CSV for sheet '{worksheet.title}': {csv_path}")
+        if _write_sheet_csv(worksheet, csv_path):
+            print(f"Wrote CSV for sheet '{worksheet.title}': {csv_path}")
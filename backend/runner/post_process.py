@@ -2,10 +2,20 @@
 from __future__ import annotations
 
 import json
+import re
 
 from openpyxl import load_workbook
 from openpyxl.styles import Alignment
 
+# Cheap pre-check so json.loads only runs on values that could be JSON.
+_JSON_START_RE = re.compile(r"\s*[\[{]")
+
+# Same output as json.dumps(..., indent=2) without building an encoder per cell.
+_JSON_PRETTY = json.JSONEncoder(indent=2).encode
+
+# Style objects are immutable, so one instance is shared by every cell.
+_ALIGN_CENTER_WRAP = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
 
 def post_process_workbook(workbook):
     """Apply formatting, alignment, and JSON pretty-printing to the workbook."""
@@ -20,44 +30,39 @@ def post_process_workbook(workbook):
                 break
 
         for _, cell in enumerate(worksheet[1], 1):
-            cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+            cell.alignment = _ALIGN_CENTER_WRAP
         worksheet.row_dimensions[1].height = header_height
 
+        # One sweep per data row: pretty-print JSON cells, apply alignment and
+        # size the row to the tallest cell (raw or reformatted).
         for idx, row in enumerate(worksheet.iter_rows(min_row=2, max_row=worksheet.max_row), start=2):
             max_lines = 1
             for cell in row:
                 value = cell.value
                 if value and isinstance(value, str):
                     lines = value.count("\n") + 1
+                    if _JSON_START_RE.match(value):
+                        try:
+                            formatted = _JSON_PRETTY(json.loads(value))
+                        except Exception:
+                            pass
+                        else:
+                            cell.value = formatted
+                            lines = max(lines, formatted.count("\n") + 1)
                     if lines > max_lines:
                         max_lines = lines
-                cell.alignment = Alignment(wrap_text=True, horizontal="center", vertical="center")
+                cell.alignment = _ALIGN_CENTER_WRAP
             worksheet.row_dimensions[idx].height = max(15 * max_lines, min_row_height)
-
-        for col_idx, _ in enumerate(worksheet[1], 1):
-            for row in range(2, worksheet.max_row + 1):
-                value = worksheet.cell(row=row, column=col_idx).value
-                if value and isinstance(value, str) and (value.strip().startswith("{") or value.strip().startswith("[")):
-                    try:
-                        parsed = json.loads(value)
-                        formatted = json.dumps(parsed, indent=2)
-                        worksheet.cell(row=row, column=col_idx).value = formatted
-                        worksheet.cell(row=row, column=col_idx).alignment = Alignment(
-                            wrap_text=True,
-                            horizontal="center",
-                            vertical="center",
-                        )
-                        lines = formatted.count("\n") + 1
-                        current_height = worksheet.row_dimensions[row].height or 0
-                        worksheet.row_dimensions[row].height = max(15 * lines, current_height, min_row_height)
-                    except Exception:
-                        pass
     return workbook
 
 
 def post_process_workbook_file(file_path: str):
-    """Load an existing workbook, post-process it, and resave in place."""
-    workbook = load_workbook(file_path)
+    """Load an existing workbook, post-process it, and resave in place.
+
+    The file is overwritten. External link caches are not loaded since the
+    generated workbooks never contain any.
+    """
+    workbook = load_workbook(file_path, keep_links=False)
     post_process_workbook(workbook)
     workbook.save(file_path)
     return workbook
@@ -1,35 +1,74 @@
 """Primary workbook generation workflow for each AWS profile."""
 from __future__ import annotations
 
+import contextlib
+import itertools
 import os
-import time
+import threading
+from typing import Any
 
 import pandas as pd
 import boto3
 from openpyxl import Workbook
-from openpyxl.cell.cell import MergedCell
-from openpyxl.styles import Alignment, Border, Font, Side
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, Side
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
 
-from aws_utils import get_session, sanitize_filename, safe_call
+from aws_utils import fanout_share, get_session, map_concurrently, sanitize_filename, safe_call
 from collectors import COLLECTOR_FUNCTIONS
-from config import EXCEL_OUTPUT_DIR, PROFILE_SERVICES, get_account_display_name
+from config import (
+    EXCEL_OUTPUT_DIR,
+    PROFILE_SERVICES,
+    PROFILE_SERVICES_SET,
+    get_account_display_name,
+    get_account_region_dir,
+    load_config_yaml,
+)
 import config as cfg
 
+# Services collected concurrently within one region. Collectors share the
+# session's clients, so their fan-out pools split the fan-out worker count
+# between them (aws_utils.fanout_share) rather than each using all of it;
+# calls in flight for one account and region stay within the connection pool.
+SERVICE_WORKERS = 8
 
-def _config_dir() -> str:
-    """Return the absolute path to the project-level config/ directory."""
-    # runner/profile_runner.py  ->  runner/  ->  backend/  ->  project root
-    return os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "config")
+# Collectors allowed to run at once against one (profile, region), across
+# every scan in the process, unless services.yaml sets
+# ``per_account_concurrency``. Keeps concurrent scans of the same account
+# from adding up to a throttling storm.
+DEFAULT_PER_ACCOUNT_CONCURRENCY = 8
+_ACCOUNT_SLOTS: dict[tuple[str, str], tuple[int, threading.Semaphore]] = {}
+_ACCOUNT_SLOTS_LOCK = threading.Lock()
+
+
+def _per_account_concurrency() -> int:
+    """Read the optional ``per_account_concurrency`` key from services.yaml."""
+    try:
+        limit = int(load_config_yaml("services.yaml").get("per_account_concurrency"))
+    except Exception:
+        return DEFAULT_PER_ACCOUNT_CONCURRENCY
+    return limit if limit > 0 else DEFAULT_PER_ACCOUNT_CONCURRENCY
+
+
+def _account_slots(profile: str, region: str, limit: int) -> threading.Semaphore:
+    """Semaphore bounding the collectors running for one profile and region.
+
+    A changed limit takes effect on the next lookup; callers still holding
+    the previous semaphore release it as usual.
+    """
+    key = (profile, region)
+    with _ACCOUNT_SLOTS_LOCK:
+        entry = _ACCOUNT_SLOTS.get(key)
+        if entry is None or entry[0] != limit:
+            entry = _ACCOUNT_SLOTS[key] = (limit, threading.Semaphore(limit))
+    return entry[1]
 
 
 def _read_regions_file() -> list[str]:
     """Read regions from config/regions.yaml (include minus exclude lists)."""
-    path = os.path.join(_config_dir(), "regions.yaml")
     try:
-        import yaml  # type: ignore
-        with open(path, "r") as f:
-            data = yaml.safe_load(f) or {}
+        data = load_config_yaml("regions.yaml")
         included: list[str] = [r for r in (data.get("include") or []) if r]
         excluded: set[str] = set(data.get("exclude") or [])
         regions = [r for r in included if r not in excluded]
@@ -44,6 +83,11 @@ def _read_regions_file() -> list[str]:
         return ["ap-south-1"]
 
 
+# Lowercase name -> canonical COLLECTOR_FUNCTIONS key; the registry is fixed at
+# import time, so this never needs rebuilding.
+_COLLECTOR_KEYS_BY_LOWER: dict[str, str] = {k.lower(): k for k in COLLECTOR_FUNCTIONS}
+
+
 def _read_services_file() -> list[str]:
     """Read services from config/services.yaml.
 
@@ -52,39 +96,98 @@ def _read_services_file() -> list[str]:
     case-insensitive match so the caller always gets exact COLLECTOR_FUNCTIONS
     keys back.
     """
-    path = os.path.join(_config_dir(), "services.yaml")
-    # Build lowercase -> canonical name map once
-    lower_map: dict[str, str] = {k.lower(): k for k in COLLECTOR_FUNCTIONS}
     try:
-        import yaml  # type: ignore
-        with open(path, "r") as f:
-            data = yaml.safe_load(f) or {}
+        data = load_config_yaml("services.yaml")
         mode: str = data.get("mode", "include")
         listed: list[str] = [str(s) for s in (data.get("list") or []) if s]
         if mode == "include":
             # Return only services that appear in the list (case-insensitive)
-            result: list[str] = []
-            for name in listed:
-                canonical = lower_map.get(name.lower())
-                if canonical and canonical not in result:
-                    result.append(canonical)
+            # dict.fromkeys de-duplicates in O(1) per name while keeping list order
+            resolved = (_COLLECTOR_KEYS_BY_LOWER.get(name.lower()) for name in listed)
+            result: list[str] = list(dict.fromkeys(c for c in resolved if c))
             if result:
                 return result
         else:  # exclude
             excluded_lower: set[str] = {s.lower() for s in listed}
-            return [k for k in COLLECTOR_FUNCTIONS if k.lower() not in excluded_lower]
+            return [k for low, k in _COLLECTOR_KEYS_BY_LOWER.items() if low not in excluded_lower]
     except Exception as exc:
         print(f"[WARN] Could not parse services.yaml: {exc}")
     return list(PROFILE_SERVICES)
 
 from .post_process import post_process_workbook_file
-from .utils import format_cell_value, is_cluster_column
+from .utils import format_frame, is_cluster_column
 
 
 # ---------------------------------------------------------------------------
 # Per-region output writer
 # ---------------------------------------------------------------------------
 
+# openpyxl style objects are immutable, so every cell shares these instances.
+_BOLD_FONT = Font(bold=True)
+_THIN_SIDE = Side(style="thin", color="000000")
+_THIN_BORDER = Border(left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE)
+_ALIGN_CENTER_WRAP = Alignment(horizontal="center", vertical="center", wrap_text=True)
+_ALIGN_LEFT_NOWRAP = Alignment(horizontal="left", vertical="center", wrap_text=False)
+
+
+_STYLE_HEADER = "finlens_header"
+_STYLE_CENTER = "finlens_center"
+_STYLE_LEFT = "finlens_left"
+
+
+def _register_named_styles(workbook: Workbook) -> None:
+    """Add the header/data cell styles to ``workbook``.
+
+    NamedStyle objects bind to the workbook they're added to, so each workbook
+    gets its own instances rather than sharing module-level ones.
+    """
+    workbook.add_named_style(
+        NamedStyle(name=_STYLE_HEADER, font=_BOLD_FONT, border=_THIN_BORDER, alignment=_ALIGN_CENTER_WRAP)
+    )
+    workbook.add_named_style(
+        NamedStyle(name=_STYLE_CENTER, font=DEFAULT_FONT, border=_THIN_BORDER, alignment=_ALIGN_CENTER_WRAP)
+    )
+    workbook.add_named_style(
+        NamedStyle(name=_STYLE_LEFT, font=DEFAULT_FONT, border=_THIN_BORDER, alignment=_ALIGN_LEFT_NOWRAP)
+    )
+
+
+def _styled_cell(sheet, value: Any, style: str) -> Cell:
+    cell = WriteOnlyCell(sheet, value=value)
+    cell.style = style
+    return cell
+
+
+def _write_service_sheet(sheet, formatted: pd.DataFrame) -> None:
+    """Stream one formatted service frame into a write-only worksheet.
+
+    Write-only sheets emit column widths ahead of the first row, so widths are
+    measured from the frame before anything is appended. Row heights are left
+    to ``post_process_workbook_file``, which sizes every row after the save.
+    """
+    columns = list(formatted.columns)
+    rows = list(formatted.itertuples(index=False, name=None))
+    cluster_idx = frozenset(i for i, name in enumerate(columns) if is_cluster_column(name))
+
+    for idx, name in enumerate(columns):
+        max_length = 0
+        for value in itertools.chain((name,), (row[idx] for row in rows)):
+            if value is None:
+                continue
+            for line in str(value).split("\n"):
+                if len(line) > max_length:
+                    max_length = len(line)
+        width = max(12, min(max_length + 4, 120))
+        if idx in cluster_idx:
+            width = max(width, 40)
+        sheet.column_dimensions[get_column_letter(idx + 1)].width = width
+
+    sheet.append([_styled_cell(sheet, name, _STYLE_HEADER) for name in columns])
+    styles = [_STYLE_LEFT if i in cluster_idx else _STYLE_CENTER for i in range(len(columns))]
+    for row in rows:
+        sheet.append([_styled_cell(sheet, value, style) for value, style in zip(row, styles)])
+
+
 def _save_region_output(safe_account: str, region: str, region_frames: dict[str, pd.DataFrame]) -> None:
     """Save all service data for one account+region.
 
@@ -96,136 +199,46 @@ def _save_region_output(safe_account: str, region: str, region_frames: dict[str,
               {Service}.csv          <- one CSV per service, normal header row
               {account}_{region}.xlsx <- one workbook, one sheet per service
     """
-    import config as _cfg
-    region_dir = os.path.join(_cfg.OUTPUT_BASE_DIR, safe_account, sanitize_filename(region))
-    os.makedirs(region_dir, exist_ok=True)
+    region_dir = get_account_region_dir(safe_account, region)
+    xlsx_name = f"{safe_account}_{sanitize_filename(region)}.xlsx"
+    xlsx_path = os.path.join(region_dir, xlsx_name)
 
     non_empty = {svc: df for svc, df in region_frames.items() if df is not None and not df.empty}
+    if not non_empty:
+        # The region directory stays so the API still lists the region as
+        # scanned; only a workbook left over from an earlier scan is removed.
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(xlsx_path)
+        print(f"  [Region] No data for {safe_account} / {region}; no files written")
+        return
+    # Formatted once here; the CSV and Excel writers share the result.
+    formatted_frames = {svc: format_frame(df) for svc, df in non_empty.items()}
 
     # ---- CSV: one file per service ----------------------------------------
-    for service, df in non_empty.items():
+    for service, formatted in formatted_frames.items():
         safe_svc = sanitize_filename(service.replace(" ", "_"))
         csv_path = os.path.join(region_dir, f"{safe_svc}.csv")
         try:
-            formatted = df.copy()
-            for col in formatted.columns:
-                formatted[col] = formatted[col].apply(format_cell_value)
             formatted.to_csv(csv_path, index=False)
             print(f"  [CSV] {csv_path}")
         except Exception as exc:
             print(f"  [CSV] Failed for {service}: {exc}")
 
     # ---- Excel: one workbook per region, one sheet per service -------------
-    workbook = Workbook()
-    try:
-        workbook.remove(workbook.active)
-    except Exception:
-        pass
-
-    bold_font = Font(bold=True)
-    thin_border = Border(
-        left=Side(style="thin", color="000000"),
-        right=Side(style="thin", color="000000"),
-        top=Side(style="thin", color="000000"),
-        bottom=Side(style="thin", color="000000"),
-    )
+    workbook = Workbook(write_only=True)
+    _register_named_styles(workbook)
 
     service_sequence = [svc for svc in PROFILE_SERVICES if svc in non_empty]
-    service_sequence += [svc for svc in non_empty if svc not in service_sequence]
+    service_sequence += [svc for svc in non_empty if svc not in PROFILE_SERVICES_SET]
 
     for service in service_sequence:
-        df = non_empty.get(service)
+        formatted = formatted_frames.get(service)
         sheet = workbook.create_sheet(service[:31])
-        if df is None or df.empty:
-            sheet.cell(row=1, column=1, value=f"No data for {service}")
-            sheet.row_dimensions[1].height = 24
+        if formatted is None:
+            sheet.append([f"No data for {service}"])
             continue
+        _write_service_sheet(sheet, formatted)
 
-        formatted = df.copy()
-        for col in formatted.columns:
-            formatted[col] = formatted[col].apply(format_cell_value)
-
-        per_sheet_cluster_cols: set[str] = set()
-        for col_idx, col_name in enumerate(formatted.columns, 1):
-            cell = sheet.cell(row=1, column=col_idx, value=col_name)
-            cell.font = bold_font
-            cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-            if is_cluster_column(col_name):
-                try:
-                    per_sheet_cluster_cols.add(get_column_letter(col_idx))
-                except Exception:
-                    pass
-        sheet.row_dimensions[1].height = 28
-
-        for row_idx, (_, row_vals) in enumerate(formatted.iterrows(), start=2):
-            for col_idx, val in enumerate(row_vals, start=1):
-                cell = sheet.cell(row=row_idx, column=col_idx, value=val)
-                try:
-                    col_letter = get_column_letter(col_idx)
-                    if col_letter in per_sheet_cluster_cols:
-                        cell.alignment = Alignment(wrap_text=False, horizontal="left", vertical="center")
-                    else:
-                        cell.alignment = Alignment(wrap_text=True, horizontal="center", vertical="center")
-                except Exception:
-                    cell.alignment = Alignment(wrap_text=True, horizontal="center", vertical="center")
-            sheet.row_dimensions[row_idx].height = 24
-
-        last_row = sheet.max_row
-        last_col = len(formatted.columns)
-        for r in range(1, last_row + 1):
-            for c in range(1, last_col + 1):
-                sheet.cell(row=r, column=c).border = thin_border
-
-        for column in sheet.columns:
-            col_letter = None
-            for cell in column:
-                if not isinstance(cell, MergedCell):
-                    col_letter = cell.column_letter
-                    break
-            if not col_letter:
-                continue
-            max_length = 0
-            for cell in column:
-                try:
-                    if cell.value is not None:
-                        for line in str(cell.value).split("\n"):
-                            if len(line) > max_length:
-                                max_length = len(line)
-                        if col_letter in per_sheet_cluster_cols:
-                            cell.alignment = Alignment(wrap_text=False, horizontal="left", vertical="center")
-                        else:
-                            cell.alignment = Alignment(wrap_text=True, horizontal="center", vertical="center")
-                except Exception:
-                    pass
-            width = max(12, min(max_length + 4, 120))
-            if col_letter in per_sheet_cluster_cols:
-                width = max(width, 40)
-            sheet.column_dimensions[col_letter].width = width
-
-        for row_idx in range(1, sheet.max_row + 1):
-            max_lines = 1
-            for col_idx in range(1, sheet.max_column + 1):
-                cell = sheet.cell(row=row_idx, column=col_idx)
-                if cell.value:
-                    lines = str(cell.value).count("\n") + 1
-                    if lines > max_lines:
-                        max_lines = lines
-                try:
-                    col_letter = get_column_letter(col_idx)
-                    if col_letter in per_sheet_cluster_cols:
-                        cell.alignment = Alignment(wrap_text=False, horizontal="left", vertical="center")
-                    else:
-                        cell.alignment = Alignment(wrap_text=True, horizontal="center", vertical="center")
-                except Exception:
-                    cell.alignment = Alignment(wrap_text=True, horizontal="center", vertical="center")
-            sheet.row_dimensions[row_idx].height = max(15 * max_lines, 18)
-
-    if not workbook.sheetnames:
-        ws = workbook.create_sheet("Empty")
-        ws.cell(row=1, column=1, value=f"No data collected for {safe_account} / {region}")
-
-    xlsx_name = f"{safe_account}_{sanitize_filename(region)}.xlsx"
-    xlsx_path = os.path.join(region_dir, xlsx_name)
     try:
         workbook.save(xlsx_path)
         post_process_workbook_file(xlsx_path)
@@ -256,7 +269,13 @@ def run_for_profile(profile: str) -> None:
 
     target_regions = _read_regions_file()
     selected_services = _read_services_file()
-    selected_services = [s for s in selected_services if s in COLLECTOR_FUNCTIONS]
+    # Aliases (DMS/DatabaseMigrationService, Kafka/MSK) share a collector, so
+    # keep only the first name for each collector to avoid scanning it twice.
+    by_collector: dict = {}
+    for service in selected_services:
+        if service in COLLECTOR_FUNCTIONS:
+            by_collector.setdefault(COLLECTOR_FUNCTIONS[service], service)
+    selected_services = list(by_collector.values())
     if not selected_services:
         print("services.txt contains no valid collector names. Exiting profile run.")
         return
@@ -268,22 +287,31 @@ def run_for_profile(profile: str) -> None:
         except Exception:
             pass
 
-        region_frames: dict[str, pd.DataFrame] = {}
-        for service in selected_services:
+        limit = _per_account_concurrency()
+        slots = _account_slots(profile, region, limit)
+        workers = min(SERVICE_WORKERS, limit, len(selected_services))
+
+        def _collect(service: str) -> pd.DataFrame | None:
             collector = COLLECTOR_FUNCTIONS.get(service)
             if not collector:
                 print(f"  Skipping unknown service: {service}")
-                continue
+                return None
             print(f"  Collecting {service}...")
-            dataframe = safe_call(lambda: collector(session, {}), pd.DataFrame())
+            with slots, fanout_share(workers):
+                dataframe = safe_call(lambda: collector(session, {}), pd.DataFrame())
             if dataframe is None:
                 dataframe = pd.DataFrame()
             print(f"  [{service}] shape: {dataframe.shape}")
-            region_frames[service] = dataframe
-            time.sleep(0.2)
+            return dataframe
+
+        # Collectors are independent and IO-bound, so a region's services run
+        # side by side; results keep the configured service order.
+        results = map_concurrently(_collect, selected_services, max_workers=workers)
+        region_frames: dict[str, pd.DataFrame] = {
+            service: frame for service, frame in zip(selected_services, results) if frame is not None
+        }
 
         _save_region_output(safe_account, region, region_frames)
-        time.sleep(0.5)
 
     print(f"\n=== Done: {account_name} ===")
 
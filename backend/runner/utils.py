@@ -1,9 +1,12 @@
 """Shared helper routines for the runner package."""
 from __future__ import annotations
 
+import functools
 import json
+import re
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -14,6 +17,24 @@ def is_cluster_column(name: Any) -> bool:
     return "cluster" in str(name).lower()
 
 
+# Comma-separated subnet IDs (spaces already removed), e.g. "subnet-a,subnet-b".
+_SUBNET_LIST_RE = re.compile(r"subnet-[^,]*(?:,subnet-[^,]*)*")
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_json_text(text: str) -> str:
+    """Render a JSON-looking cell; tag and policy blobs repeat across rows."""
+    try:
+        parsed = json.loads(text)
+    except Exception:
+        return text.replace("},{", "},\n{")
+    if isinstance(parsed, list):
+        return "\n".join(str(item) for item in parsed)
+    if isinstance(parsed, dict):
+        return "\n".join(f"{k}: {parsed[k]}" for k in parsed)
+    return json.dumps(parsed, indent=2)
+
+
 def format_cell_value(value: Any) -> str:
     """Normalize arbitrary values for human-readable Excel output."""
     try:
@@ -27,83 +48,122 @@ def format_cell_value(value: Any) -> str:
             return "\n".join(f"{k}: {value[k]}" for k in value)
         if isinstance(value, str):
             text = value.strip()
-            if ", " in text:
-                if all(segment.strip().startswith("subnet-") for segment in text.replace(" ", "").split(",")):
-                    return "\n".join(segment.strip() for segment in text.split(","))
-            if text.startswith("{") or text.startswith("["):
-                try:
-                    parsed = json.loads(text)
-                    if isinstance(parsed, list):
-                        return "\n".join(str(item) for item in parsed)
-                    if isinstance(parsed, dict):
-                        return "\n".join(f"{k}: {parsed[k]}" for k in parsed)
-                    return json.dumps(parsed, indent=2)
-                except Exception:
-                    return text.replace("},{", "},\n{")
+            if ", " in text and _SUBNET_LIST_RE.fullmatch(text.replace(" ", "")):
+                return "\n".join(segment.strip() for segment in text.split(","))
+            if text[:1] in ("{", "["):
+                return _format_json_text(text)
             return text.replace(", ", "\n")
         return str(value)
     except Exception:
         return str(value)
 
 
+def _format_object_cell(value: Any) -> str:
+    """``format_cell_value`` with a short path for plain strings.
+
+    Strings that can't be a subnet list or JSON only need the strip and
+    ", " -> newline rewrite; everything else takes the full scalar path.
+    """
+    if type(value) is str:
+        text = value.strip()
+        first = text[:1]
+        # Subnet lists are matched with spaces removed, so any "s..." string
+        # containing ", " may be one.
+        if first not in ("{", "[") and not (first == "s" and ", " in text):
+            return text.replace(", ", "\n")
+    return format_cell_value(value)
+
+
+def format_column(series: pd.Series) -> pd.Series:
+    """Column-wise equivalent of ``series.apply(format_cell_value)``.
+
+    Dispatches once on the column dtype instead of re-running the scalar
+    isinstance chain for every cell.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind == "b":
+        values = ["Enabled" if item else "Disabled" for item in series.tolist()]
+    elif isinstance(dtype, np.dtype) and dtype.kind in "iu":
+        values = [str(item) for item in series.tolist()]
+    elif isinstance(dtype, np.dtype) and dtype.kind == "f":
+        values = ["" if item != item else str(item) for item in series.tolist()]
+    elif dtype == object or isinstance(dtype, pd.StringDtype):
+        values = [_format_object_cell(item) for item in series.tolist()]
+    else:
+        return series.apply(format_cell_value)
+    return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
+
+def format_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a copy of ``df`` with every cell passed through ``format_cell_value``."""
+    return df.apply(format_column)
+
+
+# Columns tried in order for the flat CSV's ResourceId / Name fields.
+_RESOURCE_ID_KEYS = (
+    "ARN",
+    "ClusterARN",
+    "DBInstanceIdentifier",
+    "InstanceId",
+    "LoadBalancerArn",
+    "RepositoryArn",
+    "BucketName",
+    "APIId",
+    "FunctionName",
+    "DBClusterIdentifier",
+    "CacheClusterId",
+    "VpcId",
+    "Id",
+)
+_NAME_KEYS = (
+    "Name",
+    "ClusterName",
+    "DBInstanceIdentifier",
+    "InstanceId",
+    "LoadBalancerName",
+    "RepositoryName",
+    "BucketName",
+    "QueueName",
+    "APIName",
+    "FunctionName",
+    "CacheClusterId",
+    "VpcId",
+)
+# Identifier columns already surfaced above, so left out of KeyDetails.
+_DETAIL_IGNORE = frozenset(
+    {
+        "ARN",
+        "ClusterARN",
+        "DBInstanceIdentifier",
+        "InstanceId",
+        "LoadBalancerArn",
+        "RepositoryArn",
+        "BucketName",
+        "APIId",
+        "FunctionName",
+        "DBClusterIdentifier",
+        "CacheClusterId",
+        "VpcId",
+        "Name",
+        "ClusterName",
+        "RepositoryName",
+    }
+)
+
+
 def normalize_for_csv(service: str, df: pd.DataFrame | None, cost_map: dict[str, Any]) -> list[dict[str, Any]]:
     """Return normalized rows for flat CSV output."""
     rows: list[dict[str, Any]] = []
     if df is None or df.empty:
         return rows
-    for _, row in df.iterrows():
-        data = row.to_dict()
-        resource_id = (
-            data.get("ARN")
-            or data.get("ClusterARN")
-            or data.get("DBInstanceIdentifier")
-            or data.get("InstanceId")
-            or data.get("LoadBalancerArn")
-            or data.get("RepositoryArn")
-            or data.get("BucketName")
-            or data.get("APIId")
-            or data.get("FunctionName")
-            or data.get("DBClusterIdentifier")
-            or data.get("CacheClusterId")
-            or data.get("VpcId")
-            or data.get("Id")
-            or ""
-        )
-        name = (
-            data.get("Name")
-            or data.get("ClusterName")
-            or data.get("DBInstanceIdentifier")
-            or data.get("InstanceId")
-            or data.get("LoadBalancerName")
-            or data.get("RepositoryName")
-            or data.get("BucketName")
-            or data.get("QueueName")
-            or data.get("APIName")
-            or data.get("FunctionName")
-            or data.get("CacheClusterId")
-            or data.get("VpcId")
-            or ""
-        )
-        ignore = {
-            "ARN",
-            "ClusterARN",
-            "DBInstanceIdentifier",
-            "InstanceId",
-            "LoadBalancerArn",
-            "RepositoryArn",
-            "BucketName",
-            "APIId",
-            "FunctionName",
-            "DBClusterIdentifier",
-            "CacheClusterId",
-            "VpcId",
-            "Name",
-            "ClusterName",
-            "RepositoryName",
-        }
+    columns = df.columns.tolist()
+    for values in df.itertuples(index=False, name=None):
+        data = dict(zip(columns, values))
+        resource_id = next((data[key] for key in _RESOURCE_ID_KEYS if data.get(key)), "")
+        name = next((data[key] for key in _NAME_KEYS if data.get(key)), "")
         details: list[str] = []
         for key, value in data.items():
-            if key in ignore:
+            if key in _DETAIL_IGNORE:
                 continue
             try:
                 if isinstance(value, (list, tuple, set)):
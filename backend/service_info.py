@@ -3,20 +3,19 @@ from __future__ import annotations
 import argparse
 import os
 
-from config import OUTPUT_BASE_DIR
+from aws_utils import map_concurrently
+from config import OUTPUT_BASE_DIR, load_config_yaml
 from runner import run_for_profile
 
-# config/ directory sits one level above backend/
-_CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config")
+# Profiles are separate accounts with their own API rate limits, so a few can
+# be scanned side by side. Kept small since each one fans out further.
+PROFILE_WORKERS = 4
 
 
 def _read_profiles_yaml() -> list[str]:
     """Return enabled profile names from config/profiles.yaml."""
-    path = os.path.join(_CONFIG_DIR, "profiles.yaml")
     try:
-        import yaml  # type: ignore
-        with open(path, "r") as f:
-            data = yaml.safe_load(f) or {}
+        data = load_config_yaml("profiles.yaml")
         return [
             entry["name"]
             for entry in (data.get("profiles") or [])
@@ -62,8 +61,7 @@ def main() -> None:
             return
 
     print(f"Profiles to process: {profiles}")
-    for profile in profiles:
-        run_for_profile(profile)
+    map_concurrently(run_for_profile, profiles, max_workers=PROFILE_WORKERS)
 
     print(f"\nAll profiles processed. Output written to: {OUTPUT_BASE_DIR}")
 
@@ -4,37 +4,60 @@ import subprocess
 import argparse
 import boto3
 
-def get_profiles_from_config(config_path):
-    """Parse AWS config file for profile names.
+_HEADER_RE = re.compile(r'\[(.+)\]')
+_DEFAULT_CONFIG_PATH = os.path.expanduser('~/.aws/config')
 
-    Supports header formats: [profile name] and [default]. Returns a list of profile names.
+# config_path -> ((st_mtime_ns, st_size), parsed profiles)
+_CONFIG_CACHE = {}
+
+
+def _profile_from_header(header):
+    # Header can be 'profile name' or 'default'; some files omit the prefix
+    if header.startswith('profile '):
+        return header.split(' ', 1)[1]
+    return header
+
+
+def parse_config(config_path):
+    """Parse an AWS config file into ``{profile: {key: value}}`` in one pass.
+
+    The result is cached until the file's mtime or size changes, so checking
+    many profiles costs a single read. Treat it as read-only.
     """
-    profiles = []
-    if not os.path.exists(config_path):
-        return profiles
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    profiles = {}
+    current = None
     with open(config_path, 'r') as f:
-        current = None
         for line in f:
             line = line.strip()
             if not line or line.startswith('#'):
                 continue
-            m = re.match(r'\[(.+)\]', line)
+            m = _HEADER_RE.match(line)
             if m:
-                header = m.group(1).strip()
-                # Header can be 'profile name' or 'default'
-                if header == 'default':
-                    current = 'default'
-                    profiles.append('default')
-                elif header.startswith('profile '):
-                    current = header.split(' ', 1)[1]
-                    profiles.append(current)
-                else:
-                    # Some files may omit 'profile' prefix
-                    current = header
-                    profiles.append(current)
+                current = profiles.setdefault(_profile_from_header(m.group(1).strip()), {})
+                continue
+            if current is not None:
+                key, _, value = line.partition('=')
+                current[key.strip()] = value.strip()
+    _CONFIG_CACHE[config_path] = (stamp, profiles)
     return profiles
 
 
+def get_profiles_from_config(config_path):
+    """Parse AWS config file for profile names.
+
+    Supports header formats: [profile name] and [default]. Returns a list of profile names.
+    """
+    return list(parse_config(config_path))
+
+
 def get_profiles_from_boto3():
     try:
         sess = boto3.Session()
@@ -42,30 +65,13 @@ def get_profiles_from_boto3():
     except Exception:
         return []
 
-def profile_uses_sso(profile, config_path=os.path.expanduser('~/.aws/config')):
+def _uses_sso(settings):
+    return any(key.startswith('sso_') for key in settings)
+
+
+def profile_uses_sso(profile, config_path=_DEFAULT_CONFIG_PATH):
     # If profile has sso_start_url or sso_region in the config file, consider it SSO-enabled
-    if not os.path.exists(config_path):
-        return False
-    current = None
-    with open(config_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            m = re.match(r'\[(.+)\]', line)
-            if m:
-                header = m.group(1).strip()
-                if header == 'default':
-                    current = 'default'
-                elif header.startswith('profile '):
-                    current = header.split(' ', 1)[1]
-                else:
-                    current = header
-                continue
-            if current == profile:
-                if line.startswith('sso_'):
-                    return True
-    return False
+    return _uses_sso(parse_config(config_path).get(profile, {}))
 
 
 def sso_login_all(profiles=None, dry_run=False):
@@ -73,25 +79,38 @@ def sso_login_all(profiles=None, dry_run=False):
 
     If profiles is None, we will discover profiles via boto3 and ~/.aws/config.
     """
+    configs = parse_config(_DEFAULT_CONFIG_PATH)
     if profiles is None:
-        profiles = sorted(set(get_profiles_from_boto3() + get_profiles_from_config(os.path.expanduser('~/.aws/config'))))
+        profiles = sorted(set(get_profiles_from_boto3()) | set(configs))
     if not profiles:
         print("No AWS profiles found to attempt SSO login.")
         return
 
+    # The CLI caches one token per SSO session / start URL, so profiles that
+    # share one are covered by a single login.
+    refreshed = set()
     for p in profiles:
-        is_sso = profile_uses_sso(p)
+        settings = configs.get(p, {})
+        is_sso = _uses_sso(settings)
         if not is_sso:
             print(f"Skipping profile '{p}' (not SSO-enabled).")
             continue
+        token_key = settings.get('sso_session') or settings.get('sso_start_url')
+        if token_key and token_key in refreshed:
+            print(f"Skipping profile '{p}' (SSO token for {token_key} already refreshed).")
+            continue
         print(f"Attempting SSO login for profile: {p}")
         cmd = ["aws", "sso", "login", "--profile", p]
         if dry_run:
             print("DRY RUN: would run:", ' '.join(cmd))
+            if token_key:
+                refreshed.add(token_key)
             continue
         try:
             ret = subprocess.run(cmd)
             if ret.returncode == 0:
+                if token_key:
+                    refreshed.add(token_key)
                 print(f"SSO login successful for profile: {p}")
             else:
                 print(f"SSO login failed for profile: {p} (exit {ret.returncode})")
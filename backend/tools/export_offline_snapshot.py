@@ -7,6 +7,7 @@ Output: frontend/src/generated/offlineSnapshot.ts
 from __future__ import annotations
 
 import json
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,6 +19,7 @@ OUTPUT_TS = ROOT / "frontend" / "src" / "generated" / "offlineSnapshot.ts"
 
 sys.path.insert(0, str(BACKEND_DIR))
 
+from aws_utils import map_concurrently  # type: ignore  # noqa: E402
 from api_server import (  # type: ignore  # noqa: E402
     SERVICE_NAME_MAP,
     _get_live_monthly_costs,
@@ -27,14 +29,26 @@ from api_server import (  # type: ignore  # noqa: E402
     parse_csv_to_json,
 )
 
+# Cost Explorer lookups are network bound; one per profile, several at a time.
+LIVE_COST_WORKERS = 8
+
+
+def _list_csv_files() -> list[Path]:
+    if not CSV_DIR.exists():
+        return []
+    with os.scandir(CSV_DIR) as entries:
+        names = [entry.name for entry in entries if entry.name.endswith(".csv") and entry.is_file()]
+    return [CSV_DIR / name for name in sorted(names)]
+
 
 def build_snapshot() -> dict:
     profiles = []
     services_index: dict[str, dict] = {}
     profile_data: dict[str, dict] = {}
     profile_overview: dict[str, dict] = {}
+    local_overview: dict[str, tuple[list[dict], int]] = {}
 
-    csv_files = sorted(CSV_DIR.glob("*.csv")) if CSV_DIR.exists() else []
+    csv_files = _list_csv_files()
 
     for csv_file in csv_files:
         profile = csv_file.stem
@@ -80,8 +94,18 @@ def build_snapshot() -> dict:
                 item["monthlyCost"] = round(_to_float(svc.get("monthlyCost")), 2)
             overview_items.append(item)
 
-        # Best-effort CE overlay (same as runtime API behavior)
-        live_costs = _get_live_monthly_costs(profile)
+        local_overview[profile] = (overview_items, total_resources)
+
+    # Best-effort CE overlay (same as runtime API behavior)
+    profiles_with_data = list(local_overview)
+    live_results = map_concurrently(
+        _get_live_monthly_costs,
+        profiles_with_data,
+        max_workers=LIVE_COST_WORKERS,
+    )
+
+    for profile, live_costs in zip(profiles_with_data, live_results):
+        overview_items, total_resources = local_overview[profile]
         live_total = _to_float(live_costs.get("total", 0.0))
         live_by_service = live_costs.get("byService", {}) or {}
         for item in overview_items:
@@ -118,7 +142,8 @@ def build_snapshot() -> dict:
         }
 
     # Keep service order consistent with known map first, then discovered extras
-    ordered_service_ids = list(dict.fromkeys(list(SERVICE_NAME_MAP.values()) + sorted(services_index.keys())))
+    ordered_service_ids = dict.fromkeys(SERVICE_NAME_MAP.values())
+    ordered_service_ids.update(dict.fromkeys(sorted(services_index)))
     services = [services_index[sid] for sid in ordered_service_ids if sid in services_index]
 
     return {
@@ -131,21 +156,28 @@ def build_snapshot() -> dict:
     }
 
 
+_TS_PRELUDE = (
+    "import type { ExchangeRateResponse, Profile, ProfileData, ProfileOverview, Service } from \"@/lib/api-client\";\n\n"
+    "export interface OfflineSnapshot {\n"
+    "  generatedAt: string;\n"
+    "  profiles: Profile[];\n"
+    "  services: Service[];\n"
+    "  profileData: Record<string, ProfileData>;\n"
+    "  profileOverview: Record<string, ProfileOverview>;\n"
+    "  exchangeRate: ExchangeRateResponse;\n"
+    "}\n\n"
+    "export const offlineSnapshot: OfflineSnapshot = "
+)
+
+
 def write_typescript(snapshot: dict) -> None:
     OUTPUT_TS.parent.mkdir(parents=True, exist_ok=True)
-    content = (
-        "import type { ExchangeRateResponse, Profile, ProfileData, ProfileOverview, Service } from \"@/lib/api-client\";\n\n"
-        "export interface OfflineSnapshot {\n"
-        "  generatedAt: string;\n"
-        "  profiles: Profile[];\n"
-        "  services: Service[];\n"
-        "  profileData: Record<string, ProfileData>;\n"
-        "  profileOverview: Record<string, ProfileOverview>;\n"
-        "  exchangeRate: ExchangeRateResponse;\n"
-        "}\n\n"
-        f"export const offlineSnapshot: OfflineSnapshot = {json.dumps(snapshot, ensure_ascii=False, indent=2)};\n"
-    )
-    OUTPUT_TS.write_text(content, encoding="utf-8")
+    # Stream the JSON into the file instead of building the whole module as
+    # one string first; the snapshot can run to tens of megabytes.
+    with OUTPUT_TS.open("w", encoding="utf-8") as handle:
+        handle.write(_TS_PRELUDE)
+        json.dump(snapshot, handle, ensure_ascii=False, indent=2)
+        handle.write(";\n")
 
 
 def main() -> int:
@@ -3,8 +3,9 @@
 
 from __future__ import annotations
 
+import os
 import re
-import shutil
+import zipfile
 from datetime import datetime
 from pathlib import Path
 
@@ -13,31 +14,52 @@ DIST_DIR = ROOT / "frontend" / "dist-offline"
 OUT_DIR = ROOT / "release"
 ZIP_BASENAME = OUT_DIR / "autovyn-static"
 
+# Already-compressed assets gain nothing from deflate; everything else is
+# minified text where level 1 is close to level 6 in size and much faster.
+_STORED_SUFFIXES = frozenset({".gz", ".br", ".zip", ".woff", ".woff2", ".png", ".jpg", ".jpeg", ".gif", ".webp"})
+
+_CSS_LINK_RE = re.compile(rb'<link[^>]*href="([^"]+\.css)"[^>]*>')
+_JS_SCRIPT_RE = re.compile(rb'<script[^>]*src="([^"]+\.js)"[^>]*></script>')
+
 
 def inline_assets_for_file_mode(index_path: Path) -> None:
-    html = index_path.read_text(encoding="utf-8")
+    # Work on raw bytes: the assets are spliced in unchanged, so decoding and
+    # re-encoding multi-megabyte bundles buys nothing.
+    html = index_path.read_bytes()
 
-    css_match = re.search(r'<link[^>]*href="([^"]+\.css)"[^>]*>', html)
+    css_match = _CSS_LINK_RE.search(html)
     if css_match:
-        css_href = css_match.group(1)
+        css_href = css_match.group(1).decode("utf-8")
         css_path = (index_path.parent / css_href).resolve()
-        css_content = css_path.read_text(encoding="utf-8") if css_path.exists() else ""
-        html = html.replace(css_match.group(0), f"<style>\n{css_content}\n</style>")
+        css_content = css_path.read_bytes() if css_path.exists() else b""
+        html = html[:css_match.start()] + b"<style>\n" + css_content + b"\n</style>" + html[css_match.end():]
 
-    js_match = re.search(r'<script[^>]*src="([^"]+\.js)"[^>]*></script>', html)
+    js_match = _JS_SCRIPT_RE.search(html)
     if js_match:
-        js_src = js_match.group(1)
+        js_src = js_match.group(1).decode("utf-8")
         js_path = (index_path.parent / js_src).resolve()
-        js_content = js_path.read_text(encoding="utf-8") if js_path.exists() else ""
+        js_content = js_path.read_bytes() if js_path.exists() else b""
         # Remove original script from <head> and inject before </body> so #root always exists.
-        html = html.replace(js_match.group(0), "")
-        inline_module = f"<script type=\"module\">\n{js_content}\n</script>"
-        if "</body>" in html:
-            html = html.replace("</body>", f"{inline_module}\n  </body>")
+        html = html[:js_match.start()] + html[js_match.end():]
+        inline_module = b"<script type=\"module\">\n" + js_content + b"\n</script>"
+        if b"</body>" in html:
+            html = html.replace(b"</body>", inline_module + b"\n  </body>")
         else:
-            html = f"{html}\n{inline_module}\n"
+            html = html + b"\n" + inline_module + b"\n"
+
+    index_path.write_bytes(html)
+
 
-    index_path.write_text(html, encoding="utf-8")
+def write_zip(source_dir: Path, zip_path: Path) -> Path:
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        for dirpath, dirnames, filenames in os.walk(source_dir):
+            dirnames.sort()
+            base = Path(dirpath)
+            for name in sorted(filenames):
+                path = base / name
+                compress_type = zipfile.ZIP_STORED if path.suffix.lower() in _STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+                archive.write(path, path.relative_to(source_dir).as_posix(), compress_type=compress_type)
+    return zip_path
 
 
 def main() -> int:
@@ -49,7 +71,7 @@ def main() -> int:
 
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    target_zip = shutil.make_archive(str(ZIP_BASENAME), "zip", root_dir=str(DIST_DIR))
+    target_zip = write_zip(DIST_DIR, ZIP_BASENAME.with_suffix(".zip"))
 
     print(f"Offline package created: {target_zip}")
     print(f"Created at: {datetime.now().isoformat(timespec='seconds')}")
@@ -1,53 +1,82 @@
 import argparse
+import heapq
 import json
 import math
+import operator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, timedelta
 
 import boto3
+from botocore.config import Config
 
+# Cost Explorer throttles hard; adaptive retries back off instead of failing
+# the run when the worker pool outpaces the account's request rate.
+CE_CLIENT_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": 10})
+COST_WORKERS = 8
+# Resource ids per grouped cost query.
+COST_BATCH_SIZE = 100
 
-def get_resource_ids(client, start_date, end_date):
-    resource_ids = []
-    next_token = None
+MAX_ID_WIDTH = 60
+_TRUNCATED_ID_WIDTH = MAX_ID_WIDTH - 3
+
+
+def format_resource_id(rid):
+    return rid if len(rid) <= MAX_ID_WIDTH else f"{rid[:_TRUNCATED_ID_WIDTH]}..."
 
-    while True:
-        params = {
-            "TimePeriod": {"Start": start_date, "End": end_date},
-            "Dimension": "RESOURCE_ID",
-            "MaxResults": 100
-        }
-        if next_token:
-            params["NextPageToken"] = next_token
 
+def iter_resource_ids(client, start_date, end_date):
+    params = {
+        "TimePeriod": {"Start": start_date, "End": end_date},
+        "Dimension": "RESOURCE_ID",
+        "MaxResults": 100
+    }
+
+    while True:
         response = client.get_dimension_values(**params)
-        resource_ids.extend([item["Value"] for item in response["DimensionValues"]])
-        next_token = response.get("NextPageToken")
+        for item in response["DimensionValues"]:
+            yield item["Value"]
 
+        next_token = response.get("NextPageToken")
         if not next_token:
             break
+        params["NextPageToken"] = next_token
 
-    return resource_ids
 
-
-def get_resource_cost(client, resource_id, start_date, end_date):
-    response = client.get_cost_and_usage_with_resources(
-        TimePeriod={"Start": start_date, "End": end_date},
-        Granularity="DAILY",
-        Metrics=["UnblendedCost"],
-        Filter={
+def get_resource_ids(client, start_date, end_date):
+    return list(iter_resource_ids(client, start_date, end_date))
+
+
+def get_resource_costs(client, resource_ids, start_date, end_date):
+    # Cost Explorer requires a filter on this call, so costs are fetched for
+    # one batch of ids at a time, grouped by id. Monthly buckets keep each
+    # group to one or two entries instead of one per day.
+    costs = dict.fromkeys(resource_ids, 0.0)
+    params = {
+        "TimePeriod": {"Start": start_date, "End": end_date},
+        "Granularity": "MONTHLY",
+        "Metrics": ["UnblendedCost"],
+        "Filter": {
             "Dimensions": {
                 "Key": "RESOURCE_ID",
-                "Values": [resource_id]
+                "Values": list(resource_ids)
             }
-        }
-    )
+        },
+        "GroupBy": [{"Type": "DIMENSION", "Key": "RESOURCE_ID"}]
+    }
 
-    total = 0.0
-    for result in response["ResultsByTime"]:
-        amount = float(result["Total"]["UnblendedCost"]["Amount"])
-        total += amount
+    while True:
+        response = client.get_cost_and_usage_with_resources(**params)
+        for result in response["ResultsByTime"]:
+            for group in result.get("Groups", []):
+                resource_id = group["Keys"][0]
+                costs[resource_id] = costs.get(resource_id, 0.0) + float(group["Metrics"]["UnblendedCost"]["Amount"])
 
-    return total
+        next_token = response.get("NextPageToken")
+        if not next_token:
+            break
+        params["NextPageToken"] = next_token
+
+    return costs
 
 
 def main():
@@ -58,7 +87,7 @@ def main():
     args = parser.parse_args()
 
     session = boto3.Session(profile_name=args.profile)
-    ce_client = session.client("ce", region_name="us-east-1")
+    ce_client = session.client("ce", region_name="us-east-1", config=CE_CLIENT_CONFIG)
 
     end_date = date.today()
     start_date = end_date - timedelta(days=args.days)
@@ -69,21 +98,23 @@ def main():
     resource_ids = get_resource_ids(ce_client, start_str, end_str)
     print(f"Found {len(resource_ids)} resource ids")
 
-    cost_data = []
-    for idx, resource_id in enumerate(resource_ids, start=1):
-        cost = get_resource_cost(ce_client, resource_id, start_str, end_str)
-        cost_data.append({"resource_id": resource_id, "cost_usd": cost})
+    batches = [resource_ids[i:i + COST_BATCH_SIZE] for i in range(0, len(resource_ids), COST_BATCH_SIZE)]
+    costs = {}
+    processed = 0
+    with ThreadPoolExecutor(max_workers=COST_WORKERS) as executor:
+        futures = {
+            executor.submit(get_resource_costs, ce_client, batch, start_str, end_str): batch
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            costs.update(future.result())
 
-        if idx % 10 == 0:
-            print(f"Processed {idx}/{len(resource_ids)} resources")
+            processed += len(futures[future])
+            print(f"Processed {processed}/{len(resource_ids)} resources")
 
-    cost_data.sort(key=lambda x: x["cost_usd"], reverse=True)
+    cost_data = [{"resource_id": resource_id, "cost_usd": costs.get(resource_id, 0.0)} for resource_id in resource_ids]
 
-    MAX_ID_WIDTH = 60
-    def format_resource_id(rid):
-        if len(rid) > MAX_ID_WIDTH:
-            return rid[:MAX_ID_WIDTH-3] + "..."
-        return rid
+    top_rows = heapq.nlargest(args.top, cost_data, key=operator.itemgetter("cost_usd"))
 
     header = f"Top {args.top} cost resources in profile {args.profile} for last {args.days} days"
     print("\n" + header)
@@ -91,7 +122,7 @@ def main():
     print(f"{'#':>3} | {'Resource ID':<{MAX_ID_WIDTH}} | {'Cost (USD)':>12}")
     print("-" * (3 + 2 + MAX_ID_WIDTH + 3 + 12))
 
-    for idx, entry in enumerate(cost_data[:args.top], start=1):
+    for idx, entry in enumerate(top_rows, start=1):
         resource_id = format_resource_id(entry["resource_id"] or "<no-resource-id>")
         print(f"{idx:>3} | {resource_id:<{MAX_ID_WIDTH}} | {entry['cost_usd']:>12.2f}")
 
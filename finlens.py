@@ -8,7 +8,6 @@ import sys
 import os
 import subprocess
 import time
-import webbrowser
 import signal
 import threading
 from pathlib import Path
@@ -17,8 +16,6 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from backend.config_loader import load_config
-from backend.runner import run_scan
 from backend.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,14 +24,8 @@ logger = get_logger(__name__)
 VERSION = "1.0.0"
 PRODUCT_NAME = "FinLens"
 
-# Global process tracking
-running_processes = []
-api_server_process = None
-frontend_process = None
-
-def _display_banner():
-    """Display FinLens banner"""
-    banner = f"""
+# Banner only interpolates constants, so build it once at import time
+_BANNER = f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║                                                              ║
 ║   ███████╗██╗███╗   ██╗██╗     ███████╗███╗   ██╗███████╗   ║
@@ -50,7 +41,23 @@ def _display_banner():
 
 🚀 Starting {PRODUCT_NAME} - One Command, Full Experience!
     """
-    print(banner)
+_BANNER_BYTES = (_BANNER + "\n").encode("utf-8")
+
+# Global process tracking
+running_processes = []
+api_server_process = None
+frontend_process = None
+
+def _display_banner():
+    """Display FinLens banner"""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None or (sys.stdout.encoding or "").lower().replace("-", "") != "utf8":
+        # Replaced or non-UTF-8 stdout: let the text layer do the encoding
+        print(_BANNER)
+        return
+    sys.stdout.flush()
+    buffer.write(_BANNER_BYTES)
+    buffer.flush()
 
 def cleanup_processes():
     """Clean up all spawned processes"""
@@ -103,40 +110,57 @@ def check_server_health(url, timeout=60, service_name="Server"):
     
     logger.info(f"⏳ Waiting for {service_name} to be ready...")
     start_time = time.time()
-    attempt = 0
+    next_progress = 5
+    # Probe quickly at first and back off to once a second; the session keeps
+    # the connection open between probes once the server is accepting.
+    delay = 0.05
     
-    while time.time() - start_time < timeout:
-        attempt += 1
-        try:
-            response = requests.get(url, timeout=2)
-            if response.status_code == 200:
-                elapsed = time.time() - start_time
-                logger.info(f"✅ {service_name} is ready! (took {elapsed:.1f}s)")
-                return True
-        except requests.RequestException:
-            pass
-        
-        # Show progress every 5 seconds
-        if attempt % 5 == 0:
+    with requests.Session() as session:
+        while time.time() - start_time < timeout:
+            try:
+                response = session.get(url, timeout=2)
+                if response.status_code == 200:
+                    elapsed = time.time() - start_time
+                    logger.info(f"✅ {service_name} is ready! (took {elapsed:.1f}s)")
+                    return True
+            except requests.RequestException:
+                pass
+            
+            # Show progress every 5 seconds
             elapsed = time.time() - start_time
-            logger.info(f"⏳ Still waiting for {service_name}... ({elapsed:.0f}s elapsed)")
-        
-        time.sleep(1)
+            if elapsed >= next_progress:
+                logger.info(f"⏳ Still waiting for {service_name}... ({elapsed:.0f}s elapsed)")
+                next_progress += 5
+            
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
     
     logger.error(f"❌ {service_name} failed to start within {timeout}s")
     return False
 
+def _open_server_log(name):
+    """Open logs/<name>.log for a background server's combined output.
+
+    Nothing reads the servers' output while they run, so it goes to a file
+    instead of a pipe that would fill up and stall the child. The file is
+    truncated on each start so it only holds the current run.
+    """
+    log_dir = project_root / "logs"
+    log_dir.mkdir(exist_ok=True)
+    return open(log_dir / f"{name}.log", "wb", buffering=0)
+
 def start_api_server():
     """Start the API server in background"""
     global api_server_process
     
     logger.info("🚀 Starting API server on port 8083...")
-    api_server_process = subprocess.Popen(
-        [sys.executable, "api_server.py"],
-        cwd=project_root / "frontend",
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    with _open_server_log("api_server") as log_file:
+        api_server_process = subprocess.Popen(
+            [sys.executable, "api_server.py"],
+            cwd=project_root / "frontend",
+            stdout=log_file,
+            stderr=subprocess.STDOUT
+        )
     running_processes.append(api_server_process)
     return api_server_process
 
@@ -160,12 +184,13 @@ def start_frontend_server():
         subprocess.run(["npm", "install"], cwd=frontend_dir, check=True)
     
     # Start dev server
-    frontend_process = subprocess.Popen(
-        ["npm", "run", "dev"],
-        cwd=frontend_dir,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
+    with _open_server_log("frontend") as log_file:
+        frontend_process = subprocess.Popen(
+            ["npm", "run", "dev"],
+            cwd=frontend_dir,
+            stdout=log_file,
+            stderr=subprocess.STDOUT
+        )
     running_processes.append(frontend_process)
     return frontend_process
 
@@ -189,6 +214,7 @@ def open_browser():
             subprocess.run(["start", url], shell=True, check=False)
         else:
             # Fallback to webbrowser
+            import webbrowser
             webbrowser.open(url)
             
         logger.info(f"✅ Browser opened successfully")
@@ -202,6 +228,7 @@ def docker_mode():
     
     # Load configuration
     try:
+        from backend.config_loader import load_config
         config = load_config()
         logger.info("✅ Configuration loaded successfully")
     except Exception as e:
@@ -218,6 +245,7 @@ def docker_mode():
         
         # Enhanced logging for visibility
         logger.info("🌐 Initializing AWS SDK and loading profiles...")
+        from backend.runner import run_scan
         run_scan(config)
         
         elapsed_time = time.time() - start_time
@@ -258,18 +286,18 @@ def docker_mode():
             cwd='/app',
             stdout=subprocess.PIPE, 
             stderr=subprocess.STDOUT,
-            universal_newlines=True
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1
         )
         
         logger.info("📡 API server process started, monitoring...")
         
-        # Monitor the process and log output
-        while True:
-            line = process.stdout.readline()
-            if line:
-                logger.info(f"API: {line.strip()}")
-            if process.poll() is not None:
-                break
+        # Monitor the process and log output until it closes stdout
+        for line in process.stdout:
+            logger.info(f"API: {line.strip()}")
+        process.wait()
             
     except Exception as e:
         logger.error(f"❌ API server failed: {e}")
@@ -286,11 +314,20 @@ def docker_mode():
             
         return False
 
+def _watch_process(process, exited):
+    """Block until ``process`` exits, then set ``exited``."""
+    process.wait()
+    exited.set()
+
 def local_mode():
     """Run in local mode - full orchestration"""
     logger.info("🖥️  Running in local mode")
     
     try:
+        # Scanner imports pull in boto3 and pandas; only pay for them here
+        from backend.config_loader import load_config
+        from backend.runner import run_scan
+
         # Load configuration
         config = load_config()
         logger.info("✅ Configuration loaded successfully")
@@ -328,15 +365,24 @@ def local_mode():
         logger.info("⏹️  Press Ctrl+C to stop all services")
         logger.info("="*60 + "\n")
         
-        # Wait for user to stop with periodic status checks
+        # Wait for user to stop with periodic status checks. Watcher threads
+        # wake the loop as soon as a server exits, so it only needs to tick
+        # for the status line. Windows can't interrupt the wait with Ctrl+C,
+        # so it keeps a short tick there.
+        child_exited = threading.Event()
+        for process in (api_server_process, frontend_process):
+            if process:
+                threading.Thread(target=_watch_process, args=(process, child_exited), daemon=True).start()
+        wait_timeout = 5 if os.name == "nt" else 30
+        
         try:
             last_status_check = time.time()
             while True:
-                time.sleep(5)
+                child_exited.wait(wait_timeout)
                 
                 # Check process health every 30 seconds
                 current_time = time.time()
-                if current_time - last_status_check > 30:
+                if current_time - last_status_check >= 30:
                     logger.info("📊 Status: All services running normally")
                     last_status_check = current_time
                 
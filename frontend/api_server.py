@@ -5,12 +5,298 @@ Simple API server to serve data from the FinLens data directory
 This reads the actual JSON files from your data directory structure
 """
 
+import gzip
+import logging
 import os
 import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+import mmap
+import re
+import threading
+import time
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import sys
 
+try:
+    import orjson  # Optional, much faster JSON encode/decode for large payloads
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger('finlens.api')
+
+
+def _dump_json(data):
+    """Serialize a response body to indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+# orjson can parse straight from a memory map; for big files that avoids
+# holding a full bytes copy of the file alongside the parsed result.
+MMAP_MIN_BYTES = 256 * 1024
+
+
+def _load_json_file(path):
+    """Read and parse a JSON data file"""
+    with open(path, 'rb') as f:
+        if orjson is not None:
+            try:
+                if os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        with memoryview(mapped) as view:
+                            return orjson.loads(view)
+                return orjson.loads(f.read())
+            except orjson.JSONDecodeError:
+                f.seek(0)  # e.g. NaN literals, which only the stdlib parser accepts
+        raw = f.read()
+    return json.loads(raw)
+
+
+# Body returned when a service has no data file. Only the service, region
+# and profile vary, so the rest is serialized once and each value is
+# encoded on its own into the template.
+_EMPTY_RESPONSE_TEMPLATE = _dump_json({
+    "schema_version": "1.0.0",
+    "generated_at": "2026-02-09T00:00:00.000000",
+    "service": {
+        "service_name": "SERVICE_NAME",
+        "region": "REGION",
+        "profile": "PROFILE"
+    },
+    "summary": {
+        "resource_count": 0,
+        "scan_status": "success"
+    },
+    "resources": []
+}).replace(b'"SERVICE_NAME"', b'%s').replace(b'"REGION"', b'%s').replace(b'"PROFILE"', b'%s')
+
+
+def _empty_response_body(service_name, region_code, account_name):
+    """Encoded empty-data response for a service with no data file"""
+    return _EMPTY_RESPONSE_TEMPLATE % (
+        _dump_json(service_name), _dump_json(region_code), _dump_json(account_name))
+
+
+# Request routing, matched against the path with the query string and
+# surrounding slashes removed:
+#   api/discovery[/...]
+#   api/data/{account}/{region}/{service}
+#   api/data/{account}/{region}/{category}/{service}[/...]
+_PATH_RE = re.compile(r'[^?#]*')
+_DISCOVERY_ROUTE_RE = re.compile(r'api/discovery(?:/.*)?', re.DOTALL)
+_DATA_ROUTE_RE = re.compile(r'api/data/([^/]*)/([^/]*)/([^/]*)(?:/([^/]*)(?:/.*)?)?', re.DOTALL)
+
+# Get the data directory path - check for Docker environment first. Resolved
+# once at import; the script doesn't move while the server runs.
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR == '/app':
+    # Docker container (api_server.py is in /app/)
+    DATA_ROOT = '/app/data'
+else:
+    # Local development mode (api_server.py is in frontend/)
+    DATA_ROOT = os.path.join(_SCRIPT_DIR, '..', 'data')
+
+# Discovery walks the whole data tree. The result is reused while the data
+# root is unchanged and younger than the TTL; the TTL covers changes deeper
+# in the tree, which don't touch the root's mtime.
+DISCOVERY_CACHE_TTL_SECONDS = 5
+_DISCOVERY_CACHE = {'key': None, 'value': None, 'ts': 0.0}
+_DISCOVERY_CACHE_LOCK = threading.Lock()
+
+# Legacy service file path -> (mtime_ns, region found in its content)
+_LEGACY_REGION_CACHE = {}
+
+
+def _subdirs(path):
+    """(name, path) of each subdirectory of path, from a single scandir pass"""
+    with os.scandir(path) as entries:
+        return [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+
+
+# Encoded response bodies for recently served service files, keyed by path and
+# checked against the file's mtime and size, so an unchanged file is neither
+# re-read nor re-serialized. Least recently used entries are evicted first.
+FILE_CACHE_MAX_ENTRIES = 256
+_FILE_CACHE = OrderedDict()
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def _service_file_entry(path):
+    """Cached response body for a service file, re-encoded only when the file changes"""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _FILE_CACHE_LOCK:
+        cached = _FILE_CACHE.get(path)
+        if cached is not None and cached['stamp'] == stamp:
+            _FILE_CACHE.move_to_end(path)
+            return cached
+    # Read and encode outside the lock so other requests aren't held up
+    entry = {'stamp': stamp, 'body': _dump_json(_load_json_file(path)), 'gzip': None}
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[path] = entry
+        _FILE_CACHE.move_to_end(path)
+        if len(_FILE_CACHE) > FILE_CACHE_MAX_ENTRIES:
+            _FILE_CACHE.popitem(last=False)
+    return entry
+
+
+# Bodies below this size go out uncompressed; gzip framing would outweigh the
+# savings. Level 1 keeps compression far cheaper than the bytes it saves.
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 1
+
+# Headers every JSON response carries, encoded once rather than formatted
+# header by header on each request
+_JSON_HEADERS = (
+    b'Content-Type: application/json\r\n'
+    b'Access-Control-Allow-Origin: *\r\n'
+    b'Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n'
+    b'Access-Control-Allow-Headers: Content-Type\r\n'
+    b'Vary: Accept-Encoding\r\n'
+)
+_GZIP_HEADER = b'Content-Encoding: gzip\r\n'
+
+
+def _accepts_gzip(accept_encoding):
+    """True if an Accept-Encoding header allows gzip.
+
+    An explicit gzip entry decides by its q-value; ``*`` only applies when
+    gzip isn't listed.
+    """
+    wildcard = False
+    for part in accept_encoding.split(','):
+        coding, _, params = part.partition(';')
+        coding = coding.strip().lower()
+        if coding == 'gzip':
+            return _qvalue(params) > 0
+        if coding == '*':
+            wildcard = _qvalue(params) > 0
+    return wildcard
+
+
+def _qvalue(params):
+    """q-value from an Accept-Encoding entry's parameters, 1 if absent"""
+    for param in params.split(';'):
+        name, _, value = param.partition('=')
+        if name.strip().lower() == 'q':
+            try:
+                return float(value)
+            except ValueError:
+                return 1.0
+    return 1.0
+
+
+# Per-account index of the service files on disk, so a service request is a
+# few dict lookups instead of a dozen filesystem probes. Entries are rebuilt
+# after the TTL, or when a lookup misses and the index is over a second old,
+# so files written by a running scan are picked up within a second. Requests run on separate
+# threads; two of them may rebuild the same account at once, which is wasted
+# work but harmless since each build is replaced wholesale.
+INDEX_TTL_SECONDS = 5
+# A miss rebuilds the index at most this often; requests for services that
+# have no file are common and would otherwise rescan the account every time.
+INDEX_MISS_REFRESH_SECONDS = 1
+_ACCOUNT_INDEX = {}
+
+
+def _scan_categories(services_path):
+    """{category: {service name: None}} for a services/ directory, in directory order"""
+    if not os.path.isdir(services_path):
+        return {}
+    return {
+        category_dir: dict.fromkeys(f[:-5] for f in os.listdir(category_path) if f.endswith('.json'))
+        for category_dir, category_path in _subdirs(services_path)
+    }
+
+
+def _legacy_regions(account_root, legacy_categories):
+    """Regions recorded inside an account's legacy service files"""
+    regions = []
+    for category_dir, service_names in legacy_categories.items():
+        for service_name in service_names:
+            service_file_path = os.path.join(account_root, 'services', category_dir, f'{service_name}.json')
+            try:
+                region = _legacy_file_region(service_file_path)
+            except Exception as load_error:
+                logger.warning("Discovery parsing error for %s: %s", service_file_path, load_error)
+                continue
+            if region:
+                regions.append(region)
+    return regions
+
+
+def _build_account_index(account_root):
+    """Walk one account directory, new and legacy layouts, in directory order"""
+    regions_root = os.path.join(account_root, 'regions')
+    regions = {}
+    if os.path.isdir(regions_root):
+        for region_dir, region_path in _subdirs(regions_root):
+            regions[region_dir] = _scan_categories(os.path.join(region_path, 'services'))
+    # service name -> [(region, category), ...] in the same walk order
+    by_service = {}
+    for region_dir, categories in regions.items():
+        for category_dir, service_names in categories.items():
+            for service_name in service_names:
+                by_service.setdefault(service_name, []).append((region_dir, category_dir))
+    legacy = _scan_categories(os.path.join(account_root, 'services'))
+    return {
+        'regions': regions,
+        'by_service': by_service,
+        'legacy': legacy,
+        'legacy_regions': _legacy_regions(account_root, legacy),
+        'ts': time.monotonic(),
+    }
+
+
+def _account_index(account_root, refresh=False):
+    entry = _ACCOUNT_INDEX.get(account_root)
+    if refresh or entry is None or time.monotonic() - entry['ts'] >= INDEX_TTL_SECONDS:
+        entry = _ACCOUNT_INDEX[account_root] = _build_account_index(account_root)
+    return entry
+
+
+def _find_service_file(account_root, index, region_code, service_name, category_name=None):
+    """Resolve a service file from the index, same search order as on disk"""
+    region_categories = index['regions'].get(region_code, {})
+    legacy_categories = index['legacy']
+    file_name = f'{service_name}.json'
+
+    # Determine which categories to search
+    if category_name:
+        categories_to_check = [category_name]
+    else:
+        categories_to_check = list(region_categories) + list(legacy_categories)
+
+    # Find the service file across categories: region-specific path first,
+    # then legacy path
+    for category_dir in categories_to_check:
+        if service_name in region_categories.get(category_dir, ()):
+            return os.path.join(account_root, 'regions', region_code, 'services', category_dir, file_name)
+        if service_name in legacy_categories.get(category_dir, ()):
+            return os.path.join(account_root, 'services', category_dir, file_name)
+
+    # Final fallback: search requested service in any region
+    for discovered_region, category_dir in index['by_service'].get(service_name, ()):
+        if category_name is None or category_dir == category_name:
+            return os.path.join(account_root, 'regions', discovered_region, 'services', category_dir, file_name)
+    return None
+
+
+def _legacy_file_region(path):
+    """Region recorded in a legacy service file, parsed once per file version"""
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _LEGACY_REGION_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    service_data = _load_json_file(path)
+    region = (
+        service_data.get('region')
+        or service_data.get('service', {}).get('region')
+    )
+    _LEGACY_REGION_CACHE[path] = (mtime_ns, region)
+    return region
+
 class DataAPIHandler(BaseHTTPRequestHandler):
     @staticmethod
     def _add_service(discovery_result, account_name, category_name, service_name):
@@ -28,29 +314,26 @@ class DataAPIHandler(BaseHTTPRequestHandler):
 
     def do_GET(self):
         """Handle GET requests for service data and discovery"""
-        parsed_path = urlparse(self.path)
-        path_parts = parsed_path.path.strip('/').split('/')
+        path = _PATH_RE.match(self.path).group().strip('/')
         
-        if len(path_parts) >= 2 and path_parts[0] == 'api':
-            if path_parts[1] == 'discovery':
-                self.serve_discovery_data()
-            elif path_parts[1] == 'data' and len(path_parts) >= 5:
-                account_name = path_parts[2]
-                region_code = path_parts[3]
-
-                if len(path_parts) == 5:
-                    service_name = path_parts[4]
-                    category_name = None
-                else:
-                    category_name = path_parts[4]
-                    service_name = path_parts[5] if len(path_parts) > 5 else None
-
-                if service_name:
-                    self.serve_service_data(account_name, region_code, service_name, category_name)
-                else:
-                    self.send_error(400, "Service name required")
+        if _DISCOVERY_ROUTE_RE.fullmatch(path):
+            self.serve_discovery_data()
+            return
+
+        data_match = _DATA_ROUTE_RE.fullmatch(path)
+        if data_match:
+            account_name, region_code, third, fourth = data_match.groups()
+            if fourth is None:
+                category_name, service_name = None, third
             else:
-                self.send_error(404, "API endpoint not found")
+                category_name, service_name = third, fourth
+
+            if service_name:
+                self.serve_service_data(account_name, region_code, service_name, category_name)
+            else:
+                self.send_error(400, "Service name required")
+        elif path.startswith('api/'):
+            self.send_error(404, "API endpoint not found")
         else:
             self.send_error(404, "Not found")
     
@@ -65,17 +348,9 @@ class DataAPIHandler(BaseHTTPRequestHandler):
     def serve_discovery_data(self):
         """Discover and return the complete file system structure"""
         try:
-            # Get the data directory path - check for Docker environment first
-            script_dir = os.path.dirname(os.path.abspath(__file__))
+            data_root = DATA_ROOT
             
-            # Check if we're in Docker container (api_server.py is in /app/)
-            if script_dir == '/app':
-                data_root = '/app/data'
-            else:
-                # Local development mode (api_server.py is in frontend/)
-                data_root = os.path.join(script_dir, '..', 'data')
-            
-            print(f"Looking for data directory at: {data_root}")  # Debug logging
+            logger.debug("Looking for data directory at: %s", data_root)
             
             discovery_result = {
                 'accounts': [],
@@ -86,207 +361,132 @@ class DataAPIHandler(BaseHTTPRequestHandler):
             if not os.path.exists(data_root):
                 self.send_json_response(discovery_result)
                 return
+
+            cache_key = (data_root, os.stat(data_root).st_mtime_ns)
+            now = time.monotonic()
+            with _DISCOVERY_CACHE_LOCK:
+                cached = (
+                    _DISCOVERY_CACHE['value']
+                    if _DISCOVERY_CACHE['key'] == cache_key
+                    and now - _DISCOVERY_CACHE['ts'] < DISCOVERY_CACHE_TTL_SECONDS
+                    else None
+                )
+            if cached is not None:
+                self.send_json_response(cached)
+                return
             
             # Discover accounts
-            for account_dir in os.listdir(data_root):
-                account_path = os.path.join(data_root, account_dir)
-                if os.path.isdir(account_path):
-                    discovery_result['accounts'].append(account_dir)
-                    discovery_result['regions'][account_dir] = []
-                    discovery_result['services'][account_dir] = {}
-
-                    # New layout:
-                    # data/{account}/regions/{region}/services/{category}/{service}.json
-                    regions_root = os.path.join(account_path, 'regions')
-                    if os.path.exists(regions_root):
-                        for region_dir in os.listdir(regions_root):
-                            region_path = os.path.join(regions_root, region_dir)
-                            if not os.path.isdir(region_path):
-                                continue
-
-                            self._add_region(discovery_result, account_dir, region_dir)
-
-                            services_path = os.path.join(region_path, 'services')
-                            if not os.path.exists(services_path):
-                                continue
-
-                            for category_dir in os.listdir(services_path):
-                                category_path = os.path.join(services_path, category_dir)
-                                if not os.path.isdir(category_path):
-                                    continue
-
-                                for service_file in os.listdir(category_path):
-                                    if service_file.endswith('.json'):
-                                        service_name = service_file[:-5]  # Remove .json extension
-                                        self._add_service(discovery_result, account_dir, category_dir, service_name)
-
-                    # Legacy layout fallback:
-                    # data/{account}/services/{category}/{service}.json
-                    legacy_services_path = os.path.join(account_path, 'services')
-                    if os.path.exists(legacy_services_path):
-                        for category_dir in os.listdir(legacy_services_path):
-                            category_path = os.path.join(legacy_services_path, category_dir)
-                            if not os.path.isdir(category_path):
-                                continue
-
-                            for service_file in os.listdir(category_path):
-                                if service_file.endswith('.json'):
-                                    service_name = service_file[:-5]  # Remove .json extension
-                                    self._add_service(discovery_result, account_dir, category_dir, service_name)
-
-                                    # Try to determine region from file content for legacy data
-                                    try:
-                                        service_file_path = os.path.join(category_path, service_file)
-                                        with open(service_file_path, 'r', encoding='utf-8') as f:
-                                            service_data = json.load(f)
-                                            region = (
-                                                service_data.get('region')
-                                                or service_data.get('service', {}).get('region')
-                                            )
-                                            self._add_region(discovery_result, account_dir, region)
-                                    except Exception as load_error:
-                                        print(f"Discovery parsing error for {service_file_path}: {load_error}")
-                    
-                    # Default region if none found
-                    if not discovery_result['regions'][account_dir]:
-                        discovery_result['regions'][account_dir] = ['ap-south-1']
-            
-            print(f"Discovery result: {discovery_result}")
+            for account_dir, account_path in _subdirs(data_root):
+                discovery_result['accounts'].append(account_dir)
+                discovery_result['regions'][account_dir] = []
+                discovery_result['services'][account_dir] = {}
+                index = _account_index(account_path)
+
+                # New layout:
+                # data/{account}/regions/{region}/services/{category}/{service}.json
+                for region_dir, categories in index['regions'].items():
+                    self._add_region(discovery_result, account_dir, region_dir)
+                    for category_dir, service_names in categories.items():
+                        for service_name in service_names:
+                            self._add_service(discovery_result, account_dir, category_dir, service_name)
+
+                # Legacy layout fallback:
+                # data/{account}/services/{category}/{service}.json
+                # Regions come from the file contents, read by the indexer
+                for category_dir, service_names in index['legacy'].items():
+                    for service_name in service_names:
+                        self._add_service(discovery_result, account_dir, category_dir, service_name)
+                for region in index['legacy_regions']:
+                    self._add_region(discovery_result, account_dir, region)
+                
+                # Default region if none found
+                if not discovery_result['regions'][account_dir]:
+                    discovery_result['regions'][account_dir] = ['ap-south-1']
+        
+            logger.debug("Discovery result: %s", discovery_result)
+            with _DISCOVERY_CACHE_LOCK:
+                _DISCOVERY_CACHE.update(key=cache_key, value=discovery_result, ts=now)
             self.send_json_response(discovery_result)
             
         except Exception as e:
-            print(f"Error in discovery: {e}")
+            logger.error("Error in discovery: %s", e)
             self.send_error(500, f"Discovery failed: {str(e)}")
 
     def serve_service_data(self, account_name, region_code, service_name, category_name=None):
         """Serve data from the actual JSON files"""
         try:
-            # Get the data directory path - check for Docker environment first
-            script_dir = os.path.dirname(os.path.abspath(__file__))
+            account_root = os.path.join(DATA_ROOT, account_name)
             
-            # Check if we're in Docker container (api_server.py is in /app/)
-            if script_dir == '/app':
-                account_root = f'/app/data/{account_name}'
-            else:
-                # Local development mode (api_server.py is in frontend/)
-                account_root = os.path.join(script_dir, '..', 'data', account_name)
-            
-            print(f"Looking for service data in account root: {account_root}")  # Debug logging
+            logger.debug("Looking for service data in account root: %s", account_root)
 
-            region_services_dir = os.path.join(account_root, 'regions', region_code, 'services')
-            legacy_services_dir = os.path.join(account_root, 'services')
-            
-            # Determine which categories to search
-            categories_to_check = []
-            if category_name:
-                categories_to_check = [category_name]
+            if os.path.isdir(account_root):
+                index = _account_index(account_root)
+                service_file = _find_service_file(account_root, index, region_code, service_name, category_name)
+                if service_file is None and time.monotonic() - index['ts'] >= INDEX_MISS_REFRESH_SECONDS:
+                    # Not in a cached index - the file may have just been written
+                    index = _account_index(account_root, refresh=True)
+                    service_file = _find_service_file(account_root, index, region_code, service_name, category_name)
             else:
-                if os.path.exists(region_services_dir):
-                    categories_to_check.extend(
-                        [c for c in os.listdir(region_services_dir) if os.path.isdir(os.path.join(region_services_dir, c))]
-                    )
-                if os.path.exists(legacy_services_dir):
-                    categories_to_check.extend(
-                        [c for c in os.listdir(legacy_services_dir) if os.path.isdir(os.path.join(legacy_services_dir, c))]
-                    )
-
-            # Find the service file across categories
-            service_file = None
-            for category_dir in categories_to_check:
-                # First try new region-specific path
-                category_path = os.path.join(region_services_dir, category_dir)
-                potential_file = os.path.join(category_path, f'{service_name}.json')
-                if os.path.exists(potential_file):
-                    service_file = potential_file
-                    break
-
-                # Then try legacy path
-                legacy_category_path = os.path.join(legacy_services_dir, category_dir)
-                legacy_file = os.path.join(legacy_category_path, f'{service_name}.json')
-                if os.path.exists(legacy_file):
-                    service_file = legacy_file
-                    break
-
-            # Final fallback: search requested service in any region
-            if service_file is None and os.path.exists(os.path.join(account_root, 'regions')):
-                regions_root = os.path.join(account_root, 'regions')
-                for discovered_region in os.listdir(regions_root):
-                    region_path = os.path.join(regions_root, discovered_region, 'services')
-                    if not os.path.isdir(region_path):
-                        continue
-
-                    search_categories = categories_to_check if category_name else [
-                        c for c in os.listdir(region_path) if os.path.isdir(os.path.join(region_path, c))
-                    ]
-
-                    for category_dir in search_categories:
-                        potential_file = os.path.join(region_path, category_dir, f'{service_name}.json')
-                        if os.path.exists(potential_file):
-                            service_file = potential_file
-                            break
-                    if service_file:
-                        break
+                service_file = None
             
             if service_file and os.path.exists(service_file):
-                with open(service_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-                self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-                self.end_headers()
-                self.wfile.write(json.dumps(data, indent=2).encode('utf-8'))
+                entry = _service_file_entry(service_file)
+                self.send_json_body(entry['body'], cache_entry=entry)
             else:
                 # Return empty structure if file not found
-                empty_data = {
-                    "schema_version": "1.0.0",
-                    "generated_at": "2026-02-09T00:00:00.000000",
-                    "service": {
-                        "service_name": service_name,
-                        "region": region_code,
-                        "profile": account_name
-                    },
-                    "summary": {
-                        "resource_count": 0,
-                        "scan_status": "success"
-                    },
-                    "resources": []
-                }
-                
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-                self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-                self.end_headers()
-                self.wfile.write(json.dumps(empty_data, indent=2).encode('utf-8'))
+                self.send_json_body(_empty_response_body(service_name, region_code, account_name))
                 
         except Exception as e:
-            print(f"Error serving data for {account_name}/{service_name}: {e}")
+            logger.error("Error serving data for %s/%s: %s", account_name, service_name, e)
             self.send_error(500, f"Internal server error: {str(e)}")
     
     def send_json_response(self, data):
         """Helper method to send JSON response with proper headers"""
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode('utf-8'))
+        self.send_json_body(_dump_json(data))
+
+    def send_json_body(self, body, cache_entry=None):
+        """Send encoded JSON, gzipped when the client accepts it.
+
+        A ``cache_entry`` from the file cache keeps the compressed body so
+        repeat requests don't compress it again.
+        """
+        gzipped = len(body) >= GZIP_MIN_BYTES and _accepts_gzip(self.headers.get('Accept-Encoding', ''))
+        if gzipped:
+            compressed = cache_entry['gzip'] if cache_entry is not None else None
+            if compressed is None:
+                compressed = gzip.compress(body, compresslevel=GZIP_LEVEL)
+                if cache_entry is not None:
+                    cache_entry['gzip'] = compressed
+            body = compressed
+
+        self.log_request(200)
+        status = '%s 200 OK\r\nServer: %s\r\nDate: %s\r\n' % (
+            self.protocol_version, self.version_string(), self.date_time_string())
+        self.wfile.write(b''.join((
+            status.encode('latin-1'),
+            _JSON_HEADERS,
+            _GZIP_HEADER if gzipped else b'',
+            b'Content-Length: %d\r\n\r\n' % len(body),
+        )))
+        self.wfile.write(body)
     
     def log_message(self, format, *args):
-        """Override to reduce logging noise"""
-        print(f"[API] {format % args}")
+        """Route access logs to the module logger, formatted only when enabled"""
+        logger.info(format, *args)
+
+    def log_error(self, format, *args):
+        """Error responses and failures stay visible at the default WARNING level"""
+        logger.warning(format, *args)
 
 def main():
     """Main function to start the API server"""
     port = 8083
     # Bind to 0.0.0.0 for Docker container access, localhost for local development
     host = '0.0.0.0'
-    server = HTTPServer((host, port), DataAPIHandler)
+    # Per-request access and debug lines are off by default; they are written
+    # synchronously and slow down every request
+    logging.basicConfig(level=logging.WARNING, format='[API] %(message)s')
+    server = ThreadingHTTPServer((host, port), DataAPIHandler)
     print(f"Starting FinLens Data API server on http://{host}:{port}")
     print("Endpoints:")
     print("  GET /api/data/{account}/{region}/{service}")